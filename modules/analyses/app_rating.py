@@ -65,6 +65,13 @@ NO_SPIDER_CHART_SUBSCALES = ["Subjective items"]
 NO_SPIDER_CHART_COLUMNS = {
     "Perceived impact": ["Further comments about the app?"],
 }
+UMARS_QUESTION_COLUMNS = {
+    subscale_name: [
+        *subscale_columns,
+        *NO_SPIDER_CHART_COLUMNS.get(subscale_name, []),
+    ]
+    for subscale_name, subscale_columns in UMARS_SUBSCALES.items()
+}
 
 
 def get_overall_app_rating_data() -> tuple[
@@ -84,10 +91,18 @@ def get_overall_app_rating_data() -> tuple[
             survey,
             subscale_columns,
         )
-        subscale_means = [
-            get_radar_chart_mean(participant_subscale_data, zeros_are_na=True)
-            for participant_subscale_data in subscale_data
-        ]
+        # Same as get_radar_chart_mean with zeros_are_na for all participants
+        subscale_values = np.asarray(subscale_data, dtype=float).reshape(
+            -1,
+            len(subscale_columns),
+        )
+        answered_values = subscale_values > 0
+        with np.errstate(invalid="ignore"):
+            subscale_means = np.where(
+                answered_values,
+                subscale_values,
+                0,
+            ).sum(axis=1) / answered_values.sum(axis=1)
         subscale_mean = get_radar_chart_mean(
             subscale_means,
             zeros_are_na=False,
@@ -152,11 +167,8 @@ def analyze_app_rating() -> None:
                 zeros_are_na=True,
                 title_addition=title_addition,
             )
-        question_columns = subscale_columns
-        if subscale_name in NO_SPIDER_CHART_COLUMNS:
-            question_columns += NO_SPIDER_CHART_COLUMNS[subscale_name]
         plot_per_question(
             survey=survey,
-            columns=question_columns,
+            columns=UMARS_QUESTION_COLUMNS[subscale_name],
             subscale_name=subscale_name,
         )
@@ -2,24 +2,25 @@
 
 import logging
 
+import numpy as np
 from pandas import DataFrame
 
 from modules.definitions.constants import (
     ALL_COMPREHENSION_QUESTIONS_NUMBER,
+    ANSWER_COLUMN,
     COMPREHENSION_SCORE_FILE,
     FILE_NAME_ADDITION_PLACEHOLDER,
     PARTICIPANT_ID,
-    PARTICIPANT_SCORE_COLUMNS,
+    QUESTION_COLUMN,
     SCORE_COLUMN,
     TIME_POINT_PLACEHOLDER,
-    WRONG_ANSWERS_COLUMNS,
 )
 from modules.definitions.types import Survey, TimePoint, format_time_point_name
 from modules.survey_results.get_data import (
     filter_results_by_time_point,
     get_survey_results,
 )
-from modules.survey_results.redcap_data import get_study_group
+from modules.survey_results.redcap_data import get_study_groups
 from modules.utils.comparisons import (
     PlotData,
     create_comparison_score_plot,
@@ -62,39 +63,34 @@ def analyze_comprehension(
         Survey.COMPREHENSION,
         time_point,
     )
-    participant_scores = []
-    wrong_answers = []
-    for _, participant_data in comprehension_data.iterrows():
-        participant_id = participant_data[PARTICIPANT_ID]
-        study_group = get_study_group(participant_id)
-        if study_group is None:
-            logger.warning(
-                "No study group for participant %(participant_id)s",
-                {"participant_id": participant_id},
-            )
-            continue
-        participant_results = participant_data.tail(
-            ALL_COMPREHENSION_QUESTIONS_NUMBER,
-        )
-        participant_results = participant_results.drop(
-            drop_questions,
-        )
-        participant_score = len(
-            participant_results[participant_results == True],  # noqa: E712
-        )
-        corrected_comprehension_questions_number = (
-            ALL_COMPREHENSION_QUESTIONS_NUMBER - len(drop_questions)
-        )
-        if participant_score < corrected_comprehension_questions_number:
-            for question, answer in participant_results.items():
-                if answer != True:  # noqa: E712
-                    wrong_answers.append([participant_id, question, answer])
-        participant_scores.append(
-            [participant_id, participant_score],
+    study_groups = comprehension_data[PARTICIPANT_ID].map(get_study_groups())
+    for participant_id in comprehension_data[PARTICIPANT_ID][
+        study_groups.isna()
+    ]:
+        logger.warning(
+            "No study group for participant %(participant_id)s",
+            {"participant_id": participant_id},
         )
+    comprehension_data = comprehension_data[study_groups.notna()]
+    question_columns = comprehension_data.columns[
+        -ALL_COMPREHENSION_QUESTIONS_NUMBER:
+    ].drop(drop_questions)
+    question_data = comprehension_data[question_columns]
+    correct_answers = question_data.eq(True).to_numpy()  # noqa: FBT003
+    participant_ids = comprehension_data[PARTICIPANT_ID].to_numpy()
+    wrong_rows, wrong_columns = np.nonzero(~correct_answers)
+    wrong_answers = DataFrame(
+        {
+            PARTICIPANT_ID: participant_ids[wrong_rows],
+            QUESTION_COLUMN: question_columns.to_numpy()[wrong_columns],
+            ANSWER_COLUMN: question_data.to_numpy()[wrong_rows, wrong_columns],
+        },
+    )
     participant_scores = DataFrame(
-        participant_scores,
-        columns=PARTICIPANT_SCORE_COLUMNS,
+        {
+            PARTICIPANT_ID: participant_ids,
+            SCORE_COLUMN: correct_answers.sum(axis=1),
+        },
     )
     write_data_frame(
         participant_scores,
@@ -123,7 +119,4 @@ def analyze_comprehension(
         assess_difference=False,
     )
 
-    return DataFrame(
-        wrong_answers,
-        columns=WRONG_ANSWERS_COLUMNS,
-    ), plot_data
+    return wrong_answers, plot_data
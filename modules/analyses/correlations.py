@@ -1,21 +1,20 @@
 """Code to analyze correlations."""
 
-import json
 from collections.abc import Callable
-from pathlib import Path
 
-from pandas import DataFrame, Series
+import pandas as pd
+from pandas import DataFrame, Index
 
 from modules.analyses.app_rating import get_overall_app_rating_data
 from modules.analyses.comprehension import get_comprehension_scores_file_path
 from modules.analyses.self_efficacy import get_self_efficacy_feelings_columns
 from modules.definitions.constants import (
-    COMPREHENSION_DATA,
-    EHIVE_ID,
     PARTICIPANT_ID,
+    PHARME_ID,
     SCORE_COLUMN,
 )
 from modules.definitions.types import Survey, TimePoint, format_time_point_name
+from modules.survey_results.comprehension import load_comprehension_data
 from modules.survey_results.get_data import (
     filter_results_by_time_point,
     get_defined_scores,
@@ -24,20 +23,28 @@ from modules.survey_results.get_data import (
 from modules.utils.anonymization import get_participant_id_map
 from modules.utils.data import has_multiple_time_points, load_data_from_file
 from modules.utils.output_formatting import format_output_label
-from modules.utils.redcap import get_pharme_id, get_redcap_users
+from modules.utils.redcap import (
+    get_redcap_users,
+    get_redcap_users_by_ehive_id,
+)
 
 
 def _get_correlation_data(
     data: list[DataFrame],
     drop_participant_ids: bool = True,  # noqa: FBT001, FBT002
 ) -> DataFrame:
-    correlation_data = DataFrame(columns=[PARTICIPANT_ID])
-    for current_data in data:
-        correlation_data = correlation_data.merge(
-            current_data,
-            on=PARTICIPANT_ID,
-            how="outer",
-        )
+    indexed_data = [
+        current_data.set_index(PARTICIPANT_ID) for current_data in data
+    ]
+    if not all(current_data.index.is_unique for current_data in indexed_data):
+        message = "Participant ID should be unique!"
+        raise Exception(message)  # noqa: TRY002
+    correlation_data = pd.concat(
+        indexed_data,
+        axis=1,
+        join="outer",
+        sort=True,
+    ).reset_index()
     if drop_participant_ids:
         correlation_data = correlation_data.drop(PARTICIPANT_ID, axis=1)
     return correlation_data
@@ -45,14 +52,16 @@ def _get_correlation_data(
 
 def _get_ordinal_age_data(demographic_data: DataFrame) -> DataFrame:
     age_column = "What is your age?"
-    age_data = demographic_data[[PARTICIPANT_ID, "What is your age?"]].copy(
-        deep=True,
+    return DataFrame(
+        {
+            PARTICIPANT_ID: demographic_data[PARTICIPANT_ID].to_numpy(),
+            "age": pd.Categorical(
+                demographic_data[age_column],
+                categories=sorted(demographic_data[age_column].unique()),
+                ordered=True,
+            ).codes,
+        },
     )
-    levels = sorted(age_data[age_column].unique())
-    age_data["age"] = [
-        levels.index(age_category) for age_category in age_data[age_column]
-    ]
-    return age_data.drop(age_column, axis=1)
 
 
 def _get_score_data(
@@ -93,11 +102,14 @@ def _get_score_data(
 
 def _get_umars_data() -> DataFrame:
     overall_rating_data, _, participant_ids = get_overall_app_rating_data()
-    umars_data = []
-    for index, participant_id in enumerate(participant_ids):
-        subscale_means = overall_rating_data[index]
-        umars_data.append([participant_id, Series(subscale_means).mean()])
-    return DataFrame(umars_data, columns=[PARTICIPANT_ID, SCORE_COLUMN])
+    return DataFrame(
+        {
+            PARTICIPANT_ID: participant_ids,
+            SCORE_COLUMN: DataFrame(overall_rating_data)
+            .mean(axis=1)
+            .to_numpy(),
+        },
+    )
 
 
 def _get_actions_subset_data(
@@ -105,12 +117,12 @@ def _get_actions_subset_data(
     columns: list[str],
 ) -> DataFrame:
     survey_data = filter_results_by_time_point(Survey.ACTIONS, time_point)
-    subset_data = []
-    for _, row in survey_data.iterrows():
-        participant_id = row[PARTICIPANT_ID]
-        participant_data = any(row[columns] == "yes")
-        subset_data.append([participant_id, participant_data])
-    return DataFrame(subset_data, columns=[PARTICIPANT_ID, "bool"])
+    return DataFrame(
+        {
+            PARTICIPANT_ID: survey_data[PARTICIPANT_ID].to_numpy(),
+            "bool": survey_data[columns].eq("yes").any(axis=1).to_numpy(),
+        },
+    )
 
 
 def _get_hcp_communication_data(time_point: TimePoint) -> DataFrame:
@@ -159,14 +171,14 @@ def _get_hcp_medication_change_data(time_point: TimePoint) -> DataFrame:
 
 def _get_correlation_columns(
     variable: str,
-    correlations: DataFrame,
+    correlation_data: DataFrame,
 ) -> list[str]:
     return (
         [variable]
-        if variable in correlations.columns
+        if variable in correlation_data.columns
         else [
             column
-            for column in correlations.columns
+            for column in correlation_data.columns
             if column.startswith(variable)
         ]
     )
@@ -202,9 +214,9 @@ def _get_medication_comprehension_column_name(
     )
 
 
-def _get_comprehension_questionnaire_medications() -> list[str]:
-    with Path.open(COMPREHENSION_DATA) as comprehension_data_file:
-        comprehension_data = json.load(comprehension_data_file)
+def _get_comprehension_questionnaire_medications(
+    comprehension_data: dict,
+) -> list[str]:
     return sorted(
         next(iter(comprehension_data.values()))["medications"].keys(),
     )
@@ -231,19 +243,21 @@ def _get_specific_medication_data(
     taking_medication_column: str,
     comprehension_column: str,
 ) -> DataFrame:
-    with Path.open(COMPREHENSION_DATA) as comprehension_data_file:
-        comprehension_data = json.load(comprehension_data_file)
-    redcap_users = get_redcap_users()
+    comprehension_data = load_comprehension_data()
+    redcap_users_by_ehive_id = get_redcap_users_by_ehive_id(
+        get_redcap_users(),
+    )
     participant_map = get_participant_id_map()
     specific_medication_data = []
-    questionnaire_medications = _get_comprehension_questionnaire_medications()
+    questionnaire_medications = _get_comprehension_questionnaire_medications(
+        comprehension_data,
+    )
     taking_medications_columns = [
         f"{taking_medication_column}_{medication}"
         for medication in questionnaire_medications
     ]
-    for redcap_user in redcap_users:
-        ehive_id = redcap_user[EHIVE_ID]
-        pharme_id = get_pharme_id(redcap_users, ehive_id)
+    for ehive_id, redcap_user in redcap_users_by_ehive_id.items():
+        pharme_id = redcap_user[PHARME_ID]
         if pharme_id in comprehension_data:
             anonymous_id = participant_map[ehive_id]
             participant_comprehension_data = comprehension_data[pharme_id]
@@ -264,13 +278,17 @@ def _get_specific_medication_data(
         f"medication {medication_placeholder}, could you take it at standard "
         "dosage?"
     )
+    medication_data_columns = {
+        medication: medication_question.replace(
+            medication_placeholder,
+            medication,
+        )
+        for medication in questionnaire_medications
+    }
     specific_medication_data = DataFrame(
         specific_medication_data,
         columns=[PARTICIPANT_ID, *taking_medications_columns],
     )
-    medication_comprehension_data = {
-        PARTICIPANT_ID: [],
-    }
     comprehension_time_point_data = {}
     participant_ids = []
     for time_point in TimePoint:
@@ -278,53 +296,44 @@ def _get_specific_medication_data(
             Survey.COMPREHENSION,
             time_point,
         )
+        if not current_comprehension_data[PARTICIPANT_ID].is_unique:
+            message = "Participant ID should be unique!"
+            raise Exception(message)  # noqa: TRY002
         participant_ids += current_comprehension_data[PARTICIPANT_ID].to_list()
-        comprehension_time_point_data[time_point] = current_comprehension_data
-        for medication in questionnaire_medications:
+        comprehension_time_point_data[time_point] = (
+            current_comprehension_data.set_index(PARTICIPANT_ID)
+        )
+    participant_ids = list(dict.fromkeys(participant_ids))
+    medication_comprehension_data = {}
+    for time_point, time_point_data in comprehension_time_point_data.items():
+        for medication, data_column in medication_data_columns.items():
             medication_comprehension_data[
                 _get_medication_comprehension_column_name(
                     comprehension_column,
                     time_point,
                     medication,
                 )
-            ] = []
-    for participant_id in Series(participant_ids).unique():
-        medication_comprehension_data[PARTICIPANT_ID].append(participant_id)
-        for time_point in TimePoint:
-            time_point_data = comprehension_time_point_data[time_point]
-            for medication in questionnaire_medications:
-                data_column = medication_question.replace(
-                    medication_placeholder,
-                    medication,
-                )
-                participant_data = time_point_data[
-                    time_point_data[PARTICIPANT_ID] == participant_id
-                ][data_column]
-                if len(participant_data) > 1:
-                    message = "Participant ID should be unique!"
-                    raise Exception(message)  # noqa: TRY002
-                if len(participant_data) == 1:
-                    participant_medication_result = participant_data.iloc[0]
-                else:
-                    participant_medication_result = None
-                medication_comprehension_data[
-                    _get_medication_comprehension_column_name(
-                        comprehension_column,
-                        time_point,
-                        medication,
-                    )
-                ].append(participant_medication_result)
-    medication_comprehension_data = DataFrame.from_dict(
+            ] = time_point_data[data_column].reindex(participant_ids)
+    medication_comprehension_data = DataFrame(
         medication_comprehension_data,
-    )
+        index=Index(participant_ids, name=PARTICIPANT_ID),
+    ).reset_index()
     return _get_correlation_data(
         [specific_medication_data, medication_comprehension_data],
         drop_participant_ids=False,
     )
 
 
-def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
+def get_correlation_matrix(correlation_data: DataFrame) -> DataFrame:
+    """Get all Spearman correlations to double-check analyzed pairs."""
+    return correlation_data.corr(method="spearman")
+
+
+def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame]:
     """Define questions and analyze correlations."""
+    questionnaire_medications = _get_comprehension_questionnaire_medications(
+        load_comprehension_data(),
+    )
     demographic_data = get_survey_results(
         Survey.DEMOGRAPHICS,
     )
@@ -414,7 +423,7 @@ def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
                 f"taking_medication_{medication}",
                 f"medication_specific_comprehension_{medication}",
             ]
-            for medication in _get_comprehension_questionnaire_medications()
+            for medication in questionnaire_medications
         ],
     ]
     correlation_result_columns = [
@@ -434,18 +443,17 @@ def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
     ]
     correlation_results = []
     means_data = []
-    correlations = correlation_data.corr(method="spearman")
+    correlation_columns = {
+        variable: _get_correlation_columns(variable, correlation_data)
+        for variable in {
+            variable for pair in correlation_pairs for variable in pair
+        }
+    }
     for pair in correlation_pairs:
         first_variable = pair[0]
         second_variable = pair[1]
-        first_variable_columns = _get_correlation_columns(
-            first_variable,
-            correlations,
-        )
-        second_variable_columns = _get_correlation_columns(
-            second_variable,
-            correlations,
-        )
+        first_variable_columns = correlation_columns[first_variable]
+        second_variable_columns = correlation_columns[second_variable]
         for first_variable_column in first_variable_columns:
             for second_variable_column in second_variable_columns:
                 if _is_time_point_column(
@@ -465,10 +473,14 @@ def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
                     )
                     if first_time_point != second_time_point:
                         continue
-                correlation_value = correlations.loc[
-                    first_variable_column,
-                    second_variable_column,
-                ]
+                # Only correlating analyzed pairs; pairwise complete
+                # observations are ranked per pair, as in DataFrame.corr
+                correlation_value = correlation_data[
+                    first_variable_column
+                ].corr(
+                    correlation_data[second_variable_column],
+                    method="spearman",
+                )
                 correlation_results.append(
                     [
                         _format_correlation_variable(
@@ -484,12 +496,11 @@ def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
                         ).capitalize(),
                     ],
                 )
-                for first_value in sorted(
-                    correlation_data[first_variable_column].dropna().unique(),
-                ):
-                    value_data = correlation_data[
-                        correlation_data[first_variable_column] == first_value
-                    ]
+                value_groups = correlation_data.groupby(
+                    first_variable_column,
+                )[second_variable_column]
+                value_counts = value_groups.size()
+                for first_value, second_mean in value_groups.mean().items():
                     means_data.append(
                         [
                             _format_correlation_variable(
@@ -500,8 +511,8 @@ def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
                             ),
                             correlation_value,
                             first_value,
-                            value_data[second_variable_column].mean(),
-                            len(value_data),
+                            second_mean,
+                            value_counts[first_value],
                         ],
                     )
 
@@ -512,4 +523,4 @@ def analyze_correlations() -> tuple[DataFrame, DataFrame, DataFrame, DataFrame]:
     means_table = DataFrame(means_data, columns=means_result_columns).set_index(
         [means_result_columns[0], means_result_columns[1]],
     )
-    return correlation_table, means_table, correlations, correlation_data
+    return correlation_table, means_table, correlation_data
@@ -2,9 +2,10 @@
 
 import logging
 from collections import OrderedDict
+from functools import cached_property
 
 import pandas as pd
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, crosstab
 
 from modules.analyses.health_literacy import (
     HEALTH_LITERACY_COLUMN,
@@ -19,11 +20,13 @@ from modules.definitions.constants import (
 )
 from modules.definitions.types import StudyGroup, Survey
 from modules.survey_results.get_data import (
-    filter_results_by_study_group,
     get_defined_scores,
     get_survey_results,
 )
-from modules.survey_results.redcap_data import redcap_data_are_complete
+from modules.survey_results.redcap_data import (
+    get_study_groups,
+    redcap_data_are_complete,
+)
 from modules.utils.data import get_label_definition
 from modules.utils.output_formatting import (
     format_float,
@@ -49,8 +52,17 @@ class Demographic:
         self.name = name
         self.column = column
 
+    @cached_property
+    def label_definition(self) -> OrderedDict:
+        """Label definition of the demographic, loaded once."""
+        if self.column == RACE_COLUMN:
+            return _get_race_label_definition()
+        return get_label_definition(Survey.DEMOGRAPHICS, self.column)
+
 
 RACE_COLUMN = "What is your race?"
+TOTAL_COUNT_COLUMN = "total"
+DEMOGRAPHIC_INDEX_NAMES = ["Demographic", "Groups different (p)", "Value"]
 
 SELF_EFFICACY_TITLE = "General self efficacy**"
 SELF_EFFICACY_FOOTNOTE = "** Scores from 10 (very low) to 40 (very high)"
@@ -76,6 +88,16 @@ demographics = [
 ]
 
 
+def _split_by_study_group(data: DataFrame) -> dict[StudyGroup, DataFrame]:
+    # Group once instead of masking the data for every study group
+    study_groups = data[PARTICIPANT_ID].map(get_study_groups())
+    groups = dict(tuple(data.groupby(study_groups, sort=False)))
+    return {
+        study_group: groups.get(study_group, data.iloc[:0])
+        for study_group in StudyGroup
+    }
+
+
 def _get_descriptive_stats(data: DataFrame, column: str) -> Series:
     return Series(
         [
@@ -86,31 +108,45 @@ def _get_descriptive_stats(data: DataFrame, column: str) -> Series:
     )
 
 
-def _get_counts(
+def _get_group_counts_matrix(
     data: DataFrame,
     column: str,
     label_definition: OrderedDict,
-    study_group: StudyGroup = None,
-) -> Series:
-    if study_group is not None:
-        participant_data = filter_results_by_study_group(
-            data,
-            study_group,
-        )
-    else:
-        participant_data = data
-    count_data = participant_data[column]
-    return count_data.value_counts().sort_index(
+) -> DataFrame:
+    study_group_values = {
+        participant_id: study_group.value
+        for participant_id, study_group in get_study_groups().items()
+        if study_group is not None
+    }
+    # Participants without study group are only counted in total
+    counts = crosstab(
+        data[column],
+        data[PARTICIPANT_ID].map(study_group_values).fillna(""),
+    )
+    counts[TOTAL_COUNT_COLUMN] = counts.sum(axis=1)
+    counts = counts.reindex(
+        columns=[
+            TOTAL_COUNT_COLUMN,
+            StudyGroup.COUNSELING.value,
+            StudyGroup.PHARME.value,
+        ],
+        fill_value=0,
+    )
+    label_values = [
+        value for value in label_definition if value in counts.index
+    ]
+    if len(label_values) == len(counts):
+        # Only defined labels present, no need to compute sort indices
+        return counts.reindex(label_values)
+    return counts.sort_index(
         key=lambda values: sort_by_label(values, label_definition),
     )
 
 
-def _format_demographic_count(counts: Series, value: str) -> str:
-    if value not in counts:
+def _format_demographic_count(count: int, share: float) -> str:
+    if count == 0:
         return "0"
-    count = counts[value]
-    total = counts.to_numpy().sum()
-    return f"{count} ({format_percentage(count / total)}%)"
+    return f"{count} ({format_percentage(share)}%)"
 
 
 def _get_count_rows(
@@ -120,32 +156,23 @@ def _get_count_rows(
     label_definition: OrderedDict,
 ) -> list[list]:
     table_rows = []
-    all_counts = _get_counts(
-        data,
-        column,
-        label_definition,
-    )
-    pharme_counts = _get_counts(
-        data,
-        column,
-        label_definition,
-        StudyGroup.PHARME,
-    )
-    counseling_counts = _get_counts(
-        data,
-        column,
-        label_definition,
-        StudyGroup.COUNSELING,
-    )
+    counts = _get_group_counts_matrix(data, column, label_definition)
+    shares = counts / counts.sum()
     comparison_result = are_study_groups_different_categorical(data, column)
-    for value in all_counts.keys():  # noqa: SIM118
+    for value, value_counts, value_shares in zip(
+        counts.index,
+        counts.to_numpy(),
+        shares.to_numpy(),
+        strict=True,
+    ):
         demographic_row = [
             title,
             format_float(comparison_result.p_value),
             format_output_label(value, label_definition),
-            _format_demographic_count(all_counts, value),
-            _format_demographic_count(counseling_counts, value),
-            _format_demographic_count(pharme_counts, value),
+            *(
+                _format_demographic_count(count, share)
+                for count, share in zip(value_counts, value_shares, strict=True)
+            ),
         ]
         table_rows.append(demographic_row)
     return table_rows
@@ -161,21 +188,22 @@ def _get_race_label_definition() -> OrderedDict:
     return label_definition
 
 
-def _get_demographic_rows(
-    demographics_data: DataFrame,
-    demographic: Demographic,
-) -> list[list]:
-    label_definition = (
-        get_label_definition(Survey.DEMOGRAPHICS, demographic.column)
-        if demographic.column is not RACE_COLUMN
-        else _get_race_label_definition()
-    )
-    return _get_count_rows(
-        demographic.name.capitalize(),
-        demographics_data,
-        demographic.column,
-        label_definition,
-    )
+def _categorize_demographics(demographics_data: DataFrame) -> DataFrame:
+    for demographic in demographics:
+        column = demographic.column
+        label_definition = demographic.label_definition
+        values = demographics_data[column]
+        # Keep undefined values as categories to not lose them
+        categories = list(label_definition) + [
+            value
+            for value in values.dropna().unique()
+            if value not in label_definition
+        ]
+        demographics_data[column] = pd.Categorical(
+            values,
+            categories=categories,
+        )
+    return demographics_data
 
 
 def _get_health_literacy_rows() -> DataFrame:
@@ -190,20 +218,13 @@ def _get_health_literacy_rows() -> DataFrame:
 def _get_descriptive_rows(title: str, data: DataFrame, column: str) -> Series:
     table_rows = []
     all_stats = _get_descriptive_stats(data, column)
-    pharme_data = filter_results_by_study_group(
-        data,
-        StudyGroup.PHARME,
-    )
+    study_group_data = _split_by_study_group(data)
     pharme_stats = _get_descriptive_stats(
-        pharme_data,
+        study_group_data[StudyGroup.PHARME],
         column,
     )
-    counseling_data = filter_results_by_study_group(
-        data,
-        StudyGroup.COUNSELING,
-    )
     counseling_stats = _get_descriptive_stats(
-        counseling_data,
+        study_group_data[StudyGroup.COUNSELING],
         column,
     )
     comparison_result = are_study_groups_different_parametric(data, column)
@@ -237,31 +258,31 @@ def _get_baseline_knowledge_rows() -> DataFrame:
 
 
 def _get_participant_count(data: DataFrame) -> int:
-    return len(data[PARTICIPANT_ID].unique())
+    return data[PARTICIPANT_ID].nunique()
 
 
 def _merge_multiple_race(demographics_data: DataFrame) -> tuple[DataFrame, str]:
-    multiple_races = {
-        value
-        for value in demographics_data[RACE_COLUMN]
-        if MULTIPLE_VALUES_SEPARATOR in str(value)
-    }
+    races = demographics_data[RACE_COLUMN]
+    is_multiple_race = races.str.contains(
+        MULTIPLE_VALUES_SEPARATOR,
+        regex=False,
+        na=False,
+    )
     multiple_race_description = "*"
     label_definition = _get_race_label_definition()
-    for race in sorted(
-        multiple_races,
-        key=lambda values: sort_by_label(values, label_definition),
-    ):
+    multiple_race_counts = (
+        races[is_multiple_race]
+        .value_counts(sort=False)
+        .sort_index(
+            key=lambda values: sort_by_label(values, label_definition),
+        )
+    )
+    for race, count in multiple_race_counts.items():
         prefix = " " if multiple_race_description == "*" else "; "
-        count = demographics_data[demographics_data[RACE_COLUMN] == race][
-            RACE_COLUMN
-        ].count()
         multiple_race_description += (
             f"{prefix}{format_output_label(race, label_definition)} ({count})"
         )
-    demographics_data[RACE_COLUMN] = demographics_data[RACE_COLUMN].apply(
-        lambda value: "mixed" if value in multiple_races else value,
-    )
+    demographics_data.loc[is_multiple_race, RACE_COLUMN] = "mixed"
     return demographics_data, multiple_race_description
 
 
@@ -275,40 +296,47 @@ def get_demographic_table() -> tuple[DataFrame, list[str]]:
     if not redcap_data_are_complete():
         logger = logging.getLogger(__name__)
         logger.info("⚠️ Not all participants have study groups assigned yet!")
+    demographics_data = _categorize_demographics(demographics_data)
     demographics_table_data = []
     for demographic in demographics:
-        demographics_table_data += _get_demographic_rows(
+        demographics_table_data += _get_count_rows(
+            demographic.name.capitalize(),
             demographics_data,
-            demographic,
+            demographic.column,
+            demographic.label_definition,
         )
     demographics_table_data += _get_health_literacy_rows()
     demographics_table_data += _get_self_efficacy_rows()
     demographics_table_data += _get_baseline_knowledge_rows()
 
     total_count = _get_participant_count(demographics_data)
+    study_group_data = _split_by_study_group(demographics_data)
     counseling_count = _get_participant_count(
-        filter_results_by_study_group(demographics_data, StudyGroup.COUNSELING),
-    )
-    pharme_count = _get_participant_count(
-        filter_results_by_study_group(demographics_data, StudyGroup.PHARME),
+        study_group_data[StudyGroup.COUNSELING],
     )
+    pharme_count = _get_participant_count(study_group_data[StudyGroup.PHARME])
 
     demographics_table = DataFrame(
-        demographics_table_data,
+        [
+            row[len(DEMOGRAPHIC_INDEX_NAMES) :]
+            for row in demographics_table_data
+        ],
+        index=pd.MultiIndex.from_tuples(
+            [
+                tuple(row[: len(DEMOGRAPHIC_INDEX_NAMES)])
+                for row in demographics_table_data
+            ],
+            names=DEMOGRAPHIC_INDEX_NAMES,
+        ),
         columns=pd.MultiIndex.from_tuples(
             [
-                ("Demographic", ""),
-                ("Groups different (p)", ""),
-                ("Value", ""),
                 ("Count (%)", f"Total (n = {total_count})"),
                 ("Count (%)", f"Counseling group (n = {counseling_count})"),
                 ("Count (%)", f"PharMe group (n = {pharme_count})"),
             ],
         ),
     )
-    return demographics_table.set_index(
-        ["Demographic", "Groups different (p)", "Value"],
-    ), [
+    return demographics_table, [
         multiple_race_description,
         SELF_EFFICACY_FOOTNOTE,
         BASELINE_KNOWLEDGE_FOOTNOTE,
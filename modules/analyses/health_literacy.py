@@ -7,7 +7,7 @@ from pandas import DataFrame
 from modules.definitions.constants import PARTICIPANT_ID, SCORE_COLUMN
 from modules.definitions.types import Survey
 from modules.survey_results.get_data import get_survey_results
-from modules.utils.data import get_score_interpretation
+from modules.utils.data import get_score_interpretations
 
 HEALTH_LITERACY_TITLE = "Health literacy"
 HEALTH_LITERACY_COLUMN = "health_literacy"
@@ -34,20 +34,13 @@ def get_health_literacy_scores() -> DataFrame:
     health_literacy_data = get_survey_results(
         Survey.HEALTH_LITERACY,
     )
-    interpreted_scores = []
-    for _, row in health_literacy_data.iterrows():
-        participant_id = row[PARTICIPANT_ID]
-        brief_score = row[SCORE_COLUMN]
-        interpreted_scores.append(
-            [
-                participant_id,
-                get_score_interpretation(
-                    brief_score,
-                    BRIEF_SCORE_INTERPRETATION,
-                ),
-            ],
-        )
+    interpreted_scores = get_score_interpretations(
+        health_literacy_data[SCORE_COLUMN],
+        BRIEF_SCORE_INTERPRETATION,
+    )
     return DataFrame(
-        interpreted_scores,
-        columns=[PARTICIPANT_ID, HEALTH_LITERACY_COLUMN],
+        {
+            PARTICIPANT_ID: health_literacy_data[PARTICIPANT_ID].to_numpy(),
+            HEALTH_LITERACY_COLUMN: interpreted_scores.to_numpy(),
+        },
     )
@@ -19,28 +19,33 @@ from modules.utils.comparisons import create_comparison_plot
 from modules.utils.data import load_data_from_file
 
 
+def _get_question_label(question: str) -> str:
+    # Most specific rules first, the first matching rule defines the label
+    if "consult your care provider" in question:
+        return "Consult provider"
+    if "should your doctor also consider additional factors" in question:
+        return "Additional factors"
+    if question.startswith("Which of the following genes"):
+        return MISSING_GENE_QUESTION.capitalize()
+    if question.endswith("at standard dosage?"):
+        return get_medication_from_question(question).capitalize()
+    if question.endswith(":"):
+        return get_gene_from_question(question)
+    return "NOT HANDLED"
+
+
 def _get_label_definition_for_questions(
     questions: Series,
 ) -> dict[str, str]:
+    logger = logging.getLogger(__name__)
     label_definition = {}
-    for question in sorted(questions, reverse=True):
-        label = "NOT HANDLED"
-        if question.endswith(":"):
-            label = get_gene_from_question(question)
-        if question.endswith("at standard dosage?"):
-            label = get_medication_from_question(question).capitalize()
-        if question.startswith("Which of the following genes"):
-            label = MISSING_GENE_QUESTION.capitalize()
-        if "should your doctor also consider additional factors" in question:
-            label = "Additional factors"
-        if "consult your care provider" in question:
-            label = "Consult provider"
+    for question in sorted(questions.unique(), reverse=True):
+        label = _get_question_label(question)
         label_definition[question] = label
         if label == "NOT HANDLED":
-            logger = logging.getLogger(__name__)
             logger.info(
-                "Need to define label for '%(question)s' in"
-                "_get_label_definition_for_questions",
+                "Need to define label for '%(question)s' in "
+                "_get_question_label",
                 {"question": question},
             )
 
@@ -81,13 +86,12 @@ def analyze_wrong_comprehension_answers(
     wrong_pharme_missing_gene_answers = wrong_missing_gene_answers[
         wrong_missing_gene_answers[STUDY_GROUP] == StudyGroup.PHARME.value
     ]
-    missing_gene_wrong_answer_count = len(
-        [
-            wrong_answer_note
-            for wrong_answer_note in wrong_pharme_missing_gene_answers["notes"]
-            if not wrong_answer_note.startswith("Overwriting to true")
-        ],
-    )
+    missing_gene_wrong_answer_count = (
+        ~wrong_pharme_missing_gene_answers["notes"].str.startswith(
+            "Overwriting to true",
+            na=False,
+        )
+    ).sum()
     print(  # noqa: T201
         f"Wrong missing gene answers in PharMe arm {()}: "
         f"{missing_gene_wrong_answer_count}",
@@ -1,15 +1,31 @@
 """Constants used throughout the project."""
 
 import json
+from functools import lru_cache
+from pathlib import Path
 
 from dotenv import dotenv_values
 
 from modules.definitions.types import StudyGroup
 
+CONFIG_FILE = ".env"
+
+
+@lru_cache(maxsize=1)
+def _read_config(
+    config_version: tuple[int, int] | None,  # noqa: ARG001, part of cache key
+) -> dict[str, str]:
+    return dict(dotenv_values(CONFIG_FILE))
+
 
 def get_config() -> dict[str, str]:
-    """Read local config from .env file."""
-    return dotenv_values(".env")
+    """Read local config from .env file (re-read only if it changed)."""
+    config_path = Path(CONFIG_FILE)
+    config_version = None
+    if config_path.exists():
+        config_stat = config_path.stat()
+        config_version = (config_stat.st_mtime_ns, config_stat.st_size)
+    return dict(_read_config(config_version))
 
 
 def get_bool_from_env(key: str) -> bool:
@@ -1,5 +1,6 @@
 """Code to display study progress."""
 
+import numpy as np
 import pandas as pd
 
 from modules.definitions.constants import (
@@ -13,7 +14,10 @@ from modules.definitions.types import (
     TimePoint,
     format_time_point_name,
 )
-from modules.survey_results.redcap_data import get_redcap_data, get_study_group
+from modules.survey_results.redcap_data import (
+    get_redcap_data,
+    get_study_groups,
+)
 from modules.utils.data import load_data_from_file
 from modules.utils.redcap import get_redcap_users
 
@@ -21,34 +25,36 @@ from modules.utils.redcap import get_redcap_users
 def _get_potentially_lost_cases(
     binary_progress_data: pd.DataFrame,
 ) -> pd.DataFrame:
-    potentially_lost_cases = pd.DataFrame(
+    potentially_lost_cases = []
+    redcap_data = get_redcap_data()
+    study_groups = get_study_groups()
+    testing_completed = redcap_data.set_index(PARTICIPANT_ID)[
+        "testing_completed"
+    ].notna()
+    for participant_id, primary_outcome_answered in zip(
+        binary_progress_data[PARTICIPANT_ID],
+        binary_progress_data["comprehension_t0"],
+        strict=True,
+    ):
+        study_group = study_groups[participant_id]
+        if study_group is None:
+            continue
+        if not primary_outcome_answered:
+            potentially_lost_cases.append(
+                [
+                    participant_id,
+                    study_group.value,
+                    testing_completed[participant_id],
+                ],
+            )
+    return pd.DataFrame(
+        potentially_lost_cases,
         columns=[
             PARTICIPANT_ID,
             "study_arm",
             "testing_completed",
         ],
     )
-    redcap_data = get_redcap_data()
-    for participant_id in binary_progress_data[PARTICIPANT_ID]:
-        study_group = get_study_group(participant_id)
-        if study_group is None:
-            continue
-        binary_participant_progress_data = binary_progress_data[
-            binary_progress_data[PARTICIPANT_ID] == participant_id
-        ]
-        participant_redcap_data = redcap_data[
-            redcap_data[PARTICIPANT_ID] == participant_id
-        ]
-        primary_outcome_answered = binary_participant_progress_data[
-            "comprehension_t0"
-        ].array[0]
-        if not primary_outcome_answered:
-            potentially_lost_cases.loc[len(potentially_lost_cases.index)] = [
-                participant_id,
-                study_group.value,
-                participant_redcap_data["testing_completed"].notna().array[0],
-            ]
-    return potentially_lost_cases
 
 
 def get_study_progress() -> tuple[str, pd.DataFrame, pd.DataFrame]:
@@ -78,74 +84,66 @@ def get_study_progress() -> tuple[str, pd.DataFrame, pd.DataFrame]:
         f"Randomized (data available): {len(randomized_users)} "
         f"({len(pharme_users)} PharMe, {len(counseling_users)} counseling)\n"
     )
-    binary_columns = progress_data.columns.difference(
-        [PARTICIPANT_ID],
-    )
-    binary_progress_data = progress_data.copy(deep=True)
-    binary_progress_data[binary_columns] = binary_progress_data[
-        binary_columns
-    ].notna()
+    binary_progress_data = progress_data.notna()
+    binary_progress_data[PARTICIPANT_ID] = progress_data[PARTICIPANT_ID]
     time_point_survey_columns = {}
     time_point_survey_columns["baseline"] = [
         survey.value.name for survey in BASELINE_SURVEYS
     ]
-    for time_point in TimePoint:
-        survey_columns = [
-            column
-            for column in binary_progress_data.columns
-            if column.endswith(time_point.value.postfix)
-        ]
-        time_point_survey_columns[time_point.name] = survey_columns
+    time_point_names = {
+        time_point.value.postfix: time_point.name for time_point in TimePoint
+    }
+    for time_point_name in time_point_names.values():
+        time_point_survey_columns[time_point_name] = []
+    # Progress columns are named {survey}_{time point postfix}
+    for column in binary_progress_data.columns:
+        postfix = column.rsplit("_", maxsplit=1)[-1]
+        if postfix in time_point_names:
+            time_point_survey_columns[time_point_names[postfix]].append(column)
+    is_counseling = (
+        binary_progress_data[PARTICIPANT_ID].map(get_study_groups())
+        == StudyGroup.COUNSELING
+    ).to_numpy()
     partial_survey_overview = {}
     for time_point_name, survey_columns in time_point_survey_columns.items():
-        time_point_started = 0
-        time_point_finished = 0
         formatted_time_point_name = format_time_point_name(
             time_point_name,
         )
-        partial_survey_overview[formatted_time_point_name] = pd.DataFrame(
-            columns=[PARTICIPANT_ID, *survey_columns],
+        answered_surveys = (
+            binary_progress_data[survey_columns].to_numpy().sum(axis=1)
+        )
+        # If the participant is in the counseling group and the time point
+        # is result return, subtract one survey because of uMARS
+        ignore_umars = is_counseling & (
+            time_point_name == TimePoint.RESULT_RETURN.name
+        )
+        total_time_point_surveys = len(survey_columns) - ignore_umars
+        time_point_started = np.count_nonzero(answered_surveys)
+        time_point_finished = np.count_nonzero(
+            answered_surveys == total_time_point_surveys,
+        )
+        is_partial = (answered_surveys > 0) & (
+            answered_surveys != total_time_point_surveys
+        )
+        partial_answers = binary_progress_data.loc[is_partial, survey_columns]
+        partial_participant_surveys = pd.DataFrame(
+            np.where(partial_answers, "x", ""),
+            index=partial_answers.index,
+            columns=survey_columns,
+        )
+        if ignore_umars.any():
+            partial_participant_surveys.loc[
+                ignore_umars[is_partial],
+                "u-mars_t0",
+            ] = "-"
+        partial_participant_surveys.insert(
+            0,
+            PARTICIPANT_ID,
+            binary_progress_data.loc[is_partial, PARTICIPANT_ID],
+        )
+        partial_survey_overview[formatted_time_point_name] = (
+            partial_participant_surveys
         )
-        for participant_id in binary_progress_data[PARTICIPANT_ID]:
-            participant_time_point_data = binary_progress_data[
-                binary_progress_data[PARTICIPANT_ID] == participant_id
-            ][survey_columns]
-            answered_surveys = participant_time_point_data.squeeze().sum()
-            if answered_surveys > 0:
-                time_point_started += 1
-            total_time_point_surveys = len(survey_columns)
-            study_group = get_study_group(participant_id)
-            # If the participant is in the counseling group and the time point
-            # is result return, subtract one survey because of uMARS
-            ignore_umars = (
-                study_group is not None
-                and study_group.name == StudyGroup.COUNSELING.name
-                and time_point_name == TimePoint.RESULT_RETURN.name
-            )
-            if ignore_umars:
-                total_time_point_surveys -= 1
-            if answered_surveys == total_time_point_surveys:
-                time_point_finished += 1
-            if (
-                answered_surveys > 0
-                and answered_surveys != total_time_point_surveys
-            ):
-                partial_participant_surveys = (
-                    participant_time_point_data.copy(
-                        deep=True,
-                    )
-                    .replace(True, "x")  # noqa: FBT003
-                    .replace(False, "")  # noqa: FBT003
-                )
-                if ignore_umars:
-                    partial_participant_surveys["u-mars_t0"] = "-"
-                partial_participant_surveys[PARTICIPANT_ID] = participant_id
-                partial_survey_overview[formatted_time_point_name] = pd.concat(
-                    [
-                        partial_survey_overview[formatted_time_point_name],
-                        partial_participant_surveys,
-                    ],
-                )
         progress_message += (
             f"{formatted_time_point_name.capitalize()} surveys:"
             f" {time_point_finished}"
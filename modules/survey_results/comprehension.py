@@ -6,6 +6,7 @@ import csv
 import json
 import logging
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from pathlib import Path
 
 from pandas import DataFrame
@@ -19,6 +20,7 @@ from modules.definitions.constants import (
     MISSING_GENE_QUESTION,
     ONLY_GENOTYPE_ADAPTIONS_COMMUNICATED,
     PARTICIPANT_ID,
+    PHARME_ID,
     QUESTION_COLUMN,
     SECRET_COMPREHENSION_LOG_FILE,
     STUDY_GROUP,
@@ -30,13 +32,17 @@ from modules.survey_results.normalize import (
     replace_in_columns,
 )
 from modules.survey_results.redcap_data import get_study_group
-from modules.utils.anonymization import get_participant_id_map, reveal_ehive_id
+from modules.utils.anonymization import reveal_ehive_id
 from modules.utils.data import (
     get_data_path,
+    get_file_version,
     value_is_nan,
     write_data_frame,
 )
-from modules.utils.redcap import get_pharme_id, get_redcap_users
+from modules.utils.redcap import (
+    get_redcap_users,
+    get_redcap_users_by_ehive_id,
+)
 
 REMOVE_COMPREHENSION_COLUMN_FORMULATIONS = [
     " in the counseling session",
@@ -45,6 +51,61 @@ REMOVE_COMPREHENSION_COLUMN_FORMULATIONS = [
     " from the PharMe app",
 ]
 
+MEDICATION_AT_STANDARD_DOSE_PHENOTYPES = {
+    "ibuprofen": {
+        "gene": "CYP2C9",
+        "phenotypes": frozenset(
+            [
+                "Normal Metabolizer",
+                "Intermediate Metabolizer",
+                "Indeterminate",
+            ],
+        ),
+    },
+    "simvastatin": {
+        "gene": "SLCO1B1",
+        "phenotypes": frozenset(
+            [
+                "Increased Function",
+                "Normal Function",
+                "Indeterminate",
+            ],
+        ),
+    },
+    "citalopram": {
+        "gene": "CYP2C19",
+        "phenotypes": frozenset(
+            [
+                "Rapid Metabolizer",
+                "Normal Metabolizer",
+                "Intermediate Metabolizer",
+                "Indeterminate",
+            ],
+        ),
+    },
+    "clopidogrel": {
+        "gene": "CYP2C19",
+        "phenotypes": frozenset(
+            [
+                "Indeterminate",
+                "Ultrarapid Metabolizer",
+                "Rapid Metabolizer",
+                "Normal Metabolizer",
+            ],
+        ),
+    },
+}
+
+CYP2C9_ACTIVITY_SCORES = {
+    "*1/*1": 2.0,
+    "*1/*2": 1.5,
+    "*1/*3": 1.0,
+    "*1/*11": 1.5,
+    "*2/*2": 1.0,
+    "*2/*3": 0.5,
+    "*3/*3": 0.0,
+}
+
 
 def get_gene_from_question(question: str) -> str:
     """Get gene name from comprehension question."""
@@ -62,42 +123,69 @@ def get_medication_from_question(question: str) -> str:
     ).replace(", could you take it at standard dosage?", "")
 
 
-def _write_to_log(log_file, row: list) -> None:  # noqa: ANN001
+@lru_cache(maxsize=1)
+def _read_comprehension_data(
+    comprehension_data_version: tuple[int, int],  # noqa: ARG001, part of cache key
+) -> dict:
+    with Path.open(COMPREHENSION_DATA) as comprehension_data_file:
+        return json.load(comprehension_data_file)
+
+
+def load_comprehension_data() -> dict:
+    """Load PharMe data of participants for comprehension questions.
+
+    Parsed data are cached until the file changes and must not be altered.
+    """
+    return _read_comprehension_data(get_file_version(Path(COMPREHENSION_DATA)))
+
+
+def _write_to_log(log_file, rows: list[list]) -> None:  # noqa: ANN001
     csv_writer = csv.writer(log_file)
-    csv_writer.writerow(row)
+    csv_writer.writerows(rows)
 
 
-def _write_log_headers() -> None:
-    with Path.open(COMPREHENSION_LOG_FILE, "w") as log_file:
-        _write_to_log(
-            log_file,
-            ["timestamp", STUDY_GROUP, QUESTION_COLUMN, ANSWER_COLUMN, "notes"],
-        )
-    with Path.open(SECRET_COMPREHENSION_LOG_FILE, "w") as secret_log_file:
-        _write_to_log(secret_log_file, [PARTICIPANT_ID])
+class _PreprocessingLog:
+    """Collects preprocessing log rows to write them at once."""
 
+    def __init__(self) -> None:
+        self.rows = []
+        self.secret_rows = []
 
-def _write_preprocessing_log(
-    question: str,
-    answer: str,
-    notes: str,
-    participant_id: str,
-) -> None:
-    timestamp = datetime.strftime(
-        datetime.now(tz=UTC),
-        "%Y-%m-%d %H:%M:%S %Z",
-    )
-    study_group = get_study_group(participant_id).value
-    with Path.open(COMPREHENSION_LOG_FILE, "a") as log_file:
-        _write_to_log(
-            log_file,
-            [timestamp, study_group, question, answer, notes],
-        )
-    with Path.open(SECRET_COMPREHENSION_LOG_FILE, "a") as secret_log_file:
-        _write_to_log(
-            secret_log_file,
-            [participant_id],
+    def add(
+        self,
+        question: str,
+        answer: str,
+        notes: str,
+        participant_id: str,
+    ) -> None:
+        timestamp = datetime.strftime(
+            datetime.now(tz=UTC),
+            "%Y-%m-%d %H:%M:%S %Z",
         )
+        study_group = get_study_group(participant_id).value
+        self.rows.append([timestamp, study_group, question, answer, notes])
+        self.secret_rows.append([participant_id])
+
+    def write(self) -> None:
+        with Path.open(COMPREHENSION_LOG_FILE, "w") as log_file:
+            _write_to_log(
+                log_file,
+                [
+                    [
+                        "timestamp",
+                        STUDY_GROUP,
+                        QUESTION_COLUMN,
+                        ANSWER_COLUMN,
+                        "notes",
+                    ],
+                    *self.rows,
+                ],
+            )
+        with Path.open(SECRET_COMPREHENSION_LOG_FILE, "w") as secret_log_file:
+            _write_to_log(
+                secret_log_file,
+                [[PARTICIPANT_ID], *self.secret_rows],
+            )
 
 
 def _get_static_answer(participant_answer: str) -> bool:
@@ -106,6 +194,7 @@ def _get_static_answer(participant_answer: str) -> bool:
 
 
 def _analyze_missing_gene(
+    preprocessing_log: _PreprocessingLog,
     participant_id: str,
     participant_answer: str,
     participant_genes: dict,
@@ -122,7 +211,7 @@ def _analyze_missing_gene(
     # indeterminate
     overwrite_result = participant_answer_phenotype == "indeterminate"
     if overwrite_result:
-        _write_preprocessing_log(
+        preprocessing_log.add(
             MISSING_GENE_QUESTION,
             participant_answer,
             "Overwriting to true because Indeterminate",
@@ -130,7 +219,7 @@ def _analyze_missing_gene(
         )
         return True
     if participant_answer == "DPYD" and pharme_id in DPYD_INDETERMINATE_CASTS:
-        _write_preprocessing_log(
+        preprocessing_log.add(
             MISSING_GENE_QUESTION,
             participant_answer,
             (
@@ -155,7 +244,7 @@ def _analyze_missing_gene(
         wrong_answer_message += (
             "; ℹ️ participant selected a gene that was simplified in PharMe"  # noqa: RUF001
         )
-    _write_preprocessing_log(
+    preprocessing_log.add(
         MISSING_GENE_QUESTION,
         participant_answer,
         wrong_answer_message,
@@ -165,6 +254,7 @@ def _analyze_missing_gene(
 
 
 def _analyze_phenotype_answer(
+    preprocessing_log: _PreprocessingLog,
     participant_id: str,
     column: str,
     participant_answer: str,
@@ -185,7 +275,7 @@ def _analyze_phenotype_answer(
                 "; phenotype for participant was adapted, 👀 check if wrong "
                 "answer included there"
             )
-        _write_preprocessing_log(
+        preprocessing_log.add(
             gene,
             participant_answer,
             wrong_answer_message,
@@ -195,49 +285,14 @@ def _analyze_phenotype_answer(
 
 
 def _analyze_medication_answer(
+    preprocessing_log: _PreprocessingLog,
     participant_id: str,
     column: str,
     participant_answer: str,
     participant_data: dict,
 ) -> bool:
-    medication_at_standard_dose_phenotypes = {
-        "ibuprofen": {
-            "gene": "CYP2C9",
-            "phenotypes": [
-                "Normal Metabolizer",
-                "Intermediate Metabolizer",
-                "Indeterminate",
-            ],
-        },
-        "simvastatin": {
-            "gene": "SLCO1B1",
-            "phenotypes": [
-                "Increased Function",
-                "Normal Function",
-                "Indeterminate",
-            ],
-        },
-        "citalopram": {
-            "gene": "CYP2C19",
-            "phenotypes": [
-                "Rapid Metabolizer",
-                "Normal Metabolizer",
-                "Intermediate Metabolizer",
-                "Indeterminate",
-            ],
-        },
-        "clopidogrel": {
-            "gene": "CYP2C19",
-            "phenotypes": [
-                "Indeterminate",
-                "Ultrarapid Metabolizer",
-                "Rapid Metabolizer",
-                "Normal Metabolizer",
-            ],
-        },
-    }
     medication = get_medication_from_question(column)
-    medication_standard_dose_data = medication_at_standard_dose_phenotypes[
+    medication_standard_dose_data = MEDICATION_AT_STANDARD_DOSE_PHENOTYPES[
         medication
     ]
     medication_gene = medication_standard_dose_data["gene"]
@@ -252,23 +307,14 @@ def _analyze_medication_answer(
         participant_genotype = participant_genes[medication_gene]["genotype"]
         participant_result_details = participant_phenotype
         if medication_gene == "CYP2C9":
-            cyp2c9_activity_scores = {
-                "*1/*1": 2.0,
-                "*1/*2": 1.5,
-                "*1/*3": 1.0,
-                "*1/*11": 1.5,
-                "*2/*2": 1.0,
-                "*2/*3": 0.5,
-                "*3/*3": 0.0,
-            }
-            if participant_genotype not in cyp2c9_activity_scores:
+            if participant_genotype not in CYP2C9_ACTIVITY_SCORES:
                 error_message = (
-                    "Need to extend cyp2c9_activity_scores by "
+                    "Need to extend CYP2C9_ACTIVITY_SCORES by "
                     f"{participant_genotype}"
                 )
                 raise Exception(error_message)  # noqa: TRY002
             participant_result_details += (
-                f" ({cyp2c9_activity_scores[participant_genotype]})"
+                f" ({CYP2C9_ACTIVITY_SCORES[participant_genotype]})"
             )
         wrong_answer_message = f"{medication_gene} {participant_result_details}"
         participant_on_medication = json.loads(
@@ -278,7 +324,7 @@ def _analyze_medication_answer(
             wrong_answer_message += (
                 "; 🚨 patient is taking medication, check if counseling needed"
             )
-        _write_preprocessing_log(
+        preprocessing_log.add(
             medication,
             participant_answer,
             wrong_answer_message,
@@ -287,34 +333,26 @@ def _analyze_medication_answer(
     return answer_correct
 
 
-def _get_comprehension_result(
+def _get_comprehension_result(  # noqa: PLR0913
+    preprocessing_log: _PreprocessingLog,
+    *,
     participant_id: str,
     pharme_id: str,
     participant_answer: str,
     participant_data: dict,
     column: str,
 ) -> bool:
-    comprehension_columns = _get_comprehension_columns()
-    static_answer_columns = [
-        comprehension_columns[4],
-        comprehension_columns[5],
-    ]
-    missing_gene_column = comprehension_columns[6]
-    phenotype_answer_columns = [
-        comprehension_columns[7],
-        comprehension_columns[9],
-        comprehension_columns[11],
-    ]
-    medication_answer_columns = [
-        comprehension_columns[8],
-        comprehension_columns[10],
-        comprehension_columns[12],
-        comprehension_columns[13],
-    ]
+    (
+        static_answer_columns,
+        missing_gene_column,
+        phenotype_answer_columns,
+        medication_answer_columns,
+    ) = _get_comprehension_answer_columns()
     if column in static_answer_columns:
         return _get_static_answer(participant_answer)
     if column == missing_gene_column:
         return _analyze_missing_gene(
+            preprocessing_log,
             participant_id,
             participant_answer,
             participant_data["genes"],
@@ -322,6 +360,7 @@ def _get_comprehension_result(
         )
     if column in phenotype_answer_columns:
         return _analyze_phenotype_answer(
+            preprocessing_log,
             participant_id,
             column,
             participant_answer,
@@ -329,6 +368,7 @@ def _get_comprehension_result(
         )
     if column in medication_answer_columns:
         return _analyze_medication_answer(
+            preprocessing_log,
             participant_id,
             column,
             participant_answer,
@@ -337,11 +377,52 @@ def _get_comprehension_result(
     return participant_answer
 
 
-def _get_comprehension_columns() -> list[str]:
-    return replace_in_columns(
-        Survey.COMPREHENSION_APP,
-        REMOVE_COMPREHENSION_COLUMN_FORMULATIONS,
-        "",
+@cache
+def _get_comprehension_columns() -> tuple[str, ...]:
+    return tuple(
+        replace_in_columns(
+            Survey.COMPREHENSION_APP,
+            REMOVE_COMPREHENSION_COLUMN_FORMULATIONS,
+            "",
+        ),
+    )
+
+
+@cache
+def _get_comprehension_answer_columns() -> tuple[
+    frozenset[str],
+    str,
+    frozenset[str],
+    frozenset[str],
+]:
+    comprehension_columns = _get_comprehension_columns()
+    static_answer_columns = frozenset(
+        [
+            comprehension_columns[4],
+            comprehension_columns[5],
+        ],
+    )
+    missing_gene_column = comprehension_columns[6]
+    phenotype_answer_columns = frozenset(
+        [
+            comprehension_columns[7],
+            comprehension_columns[9],
+            comprehension_columns[11],
+        ],
+    )
+    medication_answer_columns = frozenset(
+        [
+            comprehension_columns[8],
+            comprehension_columns[10],
+            comprehension_columns[12],
+            comprehension_columns[13],
+        ],
+    )
+    return (
+        static_answer_columns,
+        missing_gene_column,
+        phenotype_answer_columns,
+        medication_answer_columns,
     )
 
 
@@ -372,37 +453,51 @@ def maybe_map_comprehension_data() -> DataFrame:
             )
             return
     logger.info("Preprocessing comprehension data...")
-    _write_log_headers()
     comprehension_columns = _get_comprehension_columns()
-    anonymous_comprehension_results = DataFrame(
-        columns=comprehension_columns,
+    anonymous_comprehension_rows = []
+    # Map participant IDs to PharMe IDs once instead of searching per row
+    redcap_users_by_ehive_id = get_redcap_users_by_ehive_id(
+        get_redcap_users(),
     )
-    redcap_users = get_redcap_users()
-    participant_id_map = get_participant_id_map()
-    with Path.open(COMPREHENSION_DATA) as comprehension_data_file:
-        comprehension_data = json.load(comprehension_data_file)
+    comprehension_data = load_comprehension_data()
     missing_comprehension_data = []
-    for index, participant_result in explicit_comprehension_results.iterrows():
-        participant_id = participant_result[PARTICIPANT_ID]
-        pharme_id = get_pharme_id(
-            redcap_users,
-            reveal_ehive_id(participant_id_map, participant_id),
-        )
-        if pharme_id not in comprehension_data:
-            missing_comprehension_data.append(pharme_id)
-            continue
-        participant_data = comprehension_data[pharme_id]
-        for column in participant_result.index:
-            if value_is_nan(participant_result[column]):
-                continue
-            participant_result[column] = _get_comprehension_result(
-                participant_id,
-                pharme_id,
-                participant_result[column],
-                participant_data,
-                column,
+    preprocessing_log = _PreprocessingLog()
+    try:
+        result_columns = explicit_comprehension_results.columns
+        for participant_values in explicit_comprehension_results.itertuples(
+            index=False,
+            name=None,
+        ):
+            participant_result = dict(
+                zip(result_columns, participant_values, strict=True),
             )
-        anonymous_comprehension_results.loc[index] = participant_result
+            participant_id = participant_result[PARTICIPANT_ID]
+            pharme_id = redcap_users_by_ehive_id[
+                reveal_ehive_id(participant_id)
+            ][PHARME_ID]
+            if pharme_id not in comprehension_data:
+                missing_comprehension_data.append(pharme_id)
+                continue
+            participant_data = comprehension_data[pharme_id]
+            for column, participant_answer in participant_result.items():
+                if value_is_nan(participant_answer):
+                    continue
+                participant_result[column] = _get_comprehension_result(
+                    preprocessing_log,
+                    participant_id=participant_id,
+                    pharme_id=pharme_id,
+                    participant_answer=participant_answer,
+                    participant_data=participant_data,
+                    column=column,
+                )
+            anonymous_comprehension_rows.append(participant_result)
+    finally:
+        preprocessing_log.write()
+    anonymous_comprehension_results = DataFrame(
+        anonymous_comprehension_rows,
+        columns=comprehension_columns,
+        dtype=object,
+    )
     missing_comprehension_data = set(missing_comprehension_data)
     if len(missing_comprehension_data) > 0:
         logger.warning(
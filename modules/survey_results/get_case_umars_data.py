@@ -77,7 +77,36 @@ REDCAP_UMARS_MAPPING = {
 }
 
 
-def maybe_update_case_umars_data() -> None:  # noqa: C901, PLR0912
+def _get_column_types(column_definitions: pd.DataFrame) -> dict[str, str]:
+    return dict(
+        zip(
+            column_definitions["title"],
+            column_definitions["type"],
+            strict=True,
+        ),
+    )
+
+
+def _get_answer_keys_by_response(survey: Survey, column: str) -> dict[int, str]:
+    answer_definitions = load_answer_definitions(survey, column)
+    # N/A included, REDCap responses are shifted by one
+    response_offset = 1 if len(answer_definitions) == 6 else 0  # noqa: PLR2004
+    return {
+        answer_definition["score"] + response_offset: answer_definition["key"]
+        for answer_definition in answer_definitions
+    }
+
+
+def _append_rows(data: pd.DataFrame, rows: list[list]) -> pd.DataFrame:
+    if len(rows) == 0:
+        return data
+    new_data = pd.DataFrame(rows, columns=data.columns)
+    if data.empty:
+        return new_data
+    return pd.concat([data, new_data], ignore_index=True)
+
+
+def maybe_update_case_umars_data() -> None:
     """Update case uMARS data, if applicable."""
     survey = Survey.APP_RATING
     case_umars_data = _initialize_case_umars_data()
@@ -85,6 +114,19 @@ def maybe_update_case_umars_data() -> None:  # noqa: C901, PLR0912
     column_definitions = load_data_from_file(
         get_definition_data_path(survey),
     )
+    column_types = _get_column_types(column_definitions)
+    present_ehive_ids = set(case_umars_data["participant_id"])
+    data_columns = [
+        column
+        for column in case_umars_data.columns
+        if column not in META_COLUMNS
+    ]
+    answer_keys_by_response = {
+        column: _get_answer_keys_by_response(survey, column)
+        for column in data_columns
+        if column_types[column] == "SINGLE_CHOICE"
+    }
+    new_case_umars_rows = []
     manual_progress_data = get_manual_progress_data()
     participant_id_map = get_participant_id_map()
     for redcap_user in redcap_users:
@@ -96,7 +138,7 @@ def maybe_update_case_umars_data() -> None:  # noqa: C901, PLR0912
             continue
         if redcap_user["app_rating_survey_complete"] == "2":
             ehive_id = redcap_user["ehive_id"]
-            if ehive_id in case_umars_data["participant_id"]:
+            if ehive_id in present_ehive_ids:
                 continue
             if (
                 get_study_group_for_redcap_user(redcap_user)
@@ -120,41 +162,17 @@ def maybe_update_case_umars_data() -> None:  # noqa: C901, PLR0912
             # Using EOS date as survey date as a workaround
             survey_date = redcap_user["eos_date"]
             participant_data = [ehive_id, survey_date, None]
-            data_columns = [
-                column
-                for column in case_umars_data.columns
-                if column not in META_COLUMNS
-            ]
             for column in data_columns:
-                column_definition = column_definitions[
-                    column_definitions["title"] == column
-                ]
-                column_type = column_definition["type"].array[0]
+                column_type = column_types[column]
                 response = redcap_user[REDCAP_UMARS_MAPPING[column]]
                 if column_type == "SINGLE_CHOICE":
-                    answer_definitions = load_answer_definitions(
-                        survey,
-                        column,
-                    )
-                    score = int(response)
-                    # N/A included
-                    if len(answer_definitions) == 6:  # noqa: PLR2004
-                        score -= 1
-                    answer_definition = next(
-                        (
-                            answer_definition
-                            for answer_definition in answer_definitions
-                            if answer_definition["score"] == score
-                        ),
-                        None,
+                    participant_data.append(
+                        answer_keys_by_response[column].get(int(response)),
                     )
-                    if answer_definition is None:
-                        participant_data.append(None)
-                    else:
-                        participant_data.append(answer_definition["key"])
                 else:
                     participant_data.append(response)
-            case_umars_data.loc[len(case_umars_data)] = participant_data
+            new_case_umars_rows.append(participant_data)
+            present_ehive_ids.add(ehive_id)
             anonymous_id = participant_id_map[ehive_id]
             time_point_name = (
                 f"{survey.value.name}_{TimePoint.RESULT_RETURN.value.postfix}"
@@ -167,6 +185,7 @@ def maybe_update_case_umars_data() -> None:  # noqa: C901, PLR0912
                 manual_progress_data[anonymous_id] = {
                     time_point_name: survey_date,
                 }
+    case_umars_data = _append_rows(case_umars_data, new_case_umars_rows)
     write_data_frame(case_umars_data, _get_manual_umars_path())
     with Path.open(MANUAL_PROGRESS_DATA, "w") as manual_progress_file:
         json.dump(manual_progress_data, manual_progress_file, indent=4)
@@ -4,16 +4,17 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Index, Series, concat, factorize
 
 from modules.definitions.constants import (
     MANUAL_PROGRESS_DATA,
     PARTICIPANT_ID,
     PROGRESS_DATA_FILE,
     SCORE_COLUMN,
-    STUDY_GROUP,
     TIME_POINT,
 )
 from modules.definitions.types import (
@@ -23,13 +24,14 @@ from modules.definitions.types import (
     TimePoint,
     format_time_point_name,
 )
-from modules.survey_results.redcap_data import get_redcap_data
+from modules.survey_results.redcap_data import get_study_group_participants
 from modules.utils.data import (
     get_data_path,
     get_definition_data_path,
+    get_file_version,
     load_answer_definitions,
+    load_cached_data_from_file,
     load_data_from_file,
-    value_is_nan,
 )
 
 
@@ -44,70 +46,117 @@ def filter_results_by_study_group(
     study_group: StudyGroup,
 ) -> DataFrame:
     """Filter results by one study group."""
-    redcap_data = get_redcap_data()
-    study_group_participants = redcap_data[
-        redcap_data[STUDY_GROUP] == study_group.value
-    ][PARTICIPANT_ID].array
     return survey_data[
-        survey_data[PARTICIPANT_ID].isin(study_group_participants)
+        survey_data[PARTICIPANT_ID].isin(
+            get_study_group_participants(study_group),
+        )
     ]
 
 
-def _participant_completed_survey(
-    participant_id: str,
+@lru_cache(maxsize=1)
+def _load_progress_data(
+    progress_version: tuple[int, int],  # noqa: ARG001, part of cache key
+) -> DataFrame:
+    return load_cached_data_from_file(PROGRESS_DATA_FILE).set_index(
+        PARTICIPANT_ID,
+    )
+
+
+def _get_time_point_indices(
+    participant_ids: Index,
     survey: Survey,
     time_point: TimePoint,
-) -> bool:
-    progress_data = load_data_from_file(
-        PROGRESS_DATA_FILE,
+) -> Series:
+    progress_data = _load_progress_data(
+        get_file_version(Path(PROGRESS_DATA_FILE)),
+    )
+    # Only the selected participants need exactly one progress row
+    progress_counts = progress_data.index.value_counts().reindex(
+        participant_ids,
+        fill_value=0,
     )
-    survey_progress_column = f"{survey.value.name}_{time_point.value.postfix}"
-    progress_time_point = progress_data[
-        progress_data[PARTICIPANT_ID] == participant_id
-    ][survey_progress_column].array
-    if len(progress_time_point) != 1:
+    if not (progress_counts == 1).all():
         error_message = (
             "🚨 The selected time point should be unique per "
             "participant and time point!"
         )
         raise ThisShouldNeverHappenError(error_message)
-    progress_time_point = progress_time_point[0]
-    return not value_is_nan(progress_time_point)
+    completed_time_points = (
+        progress_data.loc[
+            participant_ids,
+            [
+                f"{survey.value.name}_{other_time_point.value.postfix}"
+                for other_time_point in TimePoint
+                if other_time_point.value.index <= time_point.value.index
+            ],
+        ]
+        .notna()
+        .to_numpy()
+    )
+    # Earlier time points a participant missed are not in their survey results
+    missed_time_points = (~completed_time_points[:, :-1]).sum(axis=1)
+    return Series(
+        time_point.value.index - missed_time_points,
+        index=participant_ids,
+    )[completed_time_points[:, -1]]
+
+
+_filtered_results: dict[
+    tuple[Survey, TimePoint],
+    tuple[tuple[tuple[int, int], tuple[int, int]], DataFrame],
+] = {}
 
 
 def filter_results_by_time_point(
     survey: Survey,
     time_point: TimePoint,
 ) -> DataFrame:
-    """Filter survey data by specific time point."""
-    survey_results = get_survey_results(survey)
-    time_point_data = DataFrame(
-        columns=survey_results.columns,
+    """Filter survey data by specific time point.
+
+    Results are cached until the survey or progress data are modified; a copy
+    is returned so the cached results are not altered.
+    """
+    data_versions = (
+        get_file_version(get_data_path(survey)),
+        get_file_version(Path(PROGRESS_DATA_FILE)),
     )
-    current_row = 0
-    for participant_id in survey_results[PARTICIPANT_ID].unique():
-        participant_data = survey_results[
-            survey_results[PARTICIPANT_ID] == participant_id
-        ].sort_values(TIME_POINT)
-        time_point_missing = not _participant_completed_survey(
-            participant_id,
-            survey,
-            time_point,
+    filtered_results = _filtered_results.get((survey, time_point))
+    if filtered_results is None or filtered_results[0] != data_versions:
+        filtered_results = (
+            data_versions,
+            _filter_results_by_time_point(survey, time_point),
         )
-        if time_point_missing:
-            continue
-        time_point_index = time_point.value.index
-        for other_time_point in TimePoint:
-            if other_time_point.value.index == time_point.value.index:
-                break
-            if not _participant_completed_survey(
-                participant_id,
-                survey,
-                other_time_point,
-            ):
-                time_point_index -= 1
-        if time_point_index > len(participant_data.index) - 1:
-            logger = logging.getLogger(__name__)
+        _filtered_results[(survey, time_point)] = filtered_results
+    return filtered_results[1].copy()
+
+
+def _filter_results_by_time_point(
+    survey: Survey,
+    time_point: TimePoint,
+) -> DataFrame:
+    survey_results = load_cached_data_from_file(
+        get_data_path(survey),
+    ).reset_index(drop=True)
+    # Work on integer participant codes, ordered by first appearance
+    participant_codes, participant_ids = factorize(
+        survey_results[PARTICIPANT_ID],
+        use_na_sentinel=False,
+    )
+    time_point_indices = _get_time_point_indices(
+        Index(participant_ids),
+        survey,
+        time_point,
+    )
+    result_counts = Series(
+        np.bincount(participant_codes, minlength=len(participant_ids)),
+        index=participant_ids,
+    )
+    not_loaded = time_point_indices[
+        time_point_indices >= result_counts[time_point_indices.index]
+    ]
+    if len(not_loaded) > 0:
+        logger = logging.getLogger(__name__)
+        for participant_id in not_loaded.index:
             logger.warning(
                 "⚠️ Cannot select %(survey_name)s data for %(time_point)s of "
                 "participant %(participant_id)s because the survey data was "
@@ -118,53 +167,104 @@ def filter_results_by_time_point(
                     "participant_id": participant_id,
                 },
             )
-            continue
-        participant_time_point_data = participant_data.iloc[time_point_index]
-        time_point_data.loc[current_row] = participant_time_point_data
-        current_row += 1
-    return time_point_data
+    sorted_positions = (
+        survey_results[TIME_POINT].sort_values(kind="stable").index.to_numpy()
+    )
+    sorted_codes = participant_codes[sorted_positions]
+    result_indices = Series(sorted_codes).groupby(sorted_codes).cumcount()
+    selected_positions = sorted_positions[
+        result_indices.to_numpy()
+        == time_point_indices.reindex(participant_ids).to_numpy()[sorted_codes]
+    ]
+    # Keep the order of participants in the survey results
+    selected_positions = selected_positions[
+        np.argsort(participant_codes[selected_positions], kind="stable")
+    ]
+    return survey_results.iloc[selected_positions].reset_index(drop=True)
+
+
+COMPREHENSION_SCORES = {
+    "strongly_disagree": 1,
+    "disagree": 2,
+    "agree": 3,
+    "strongly_agree": 4,
+}
 
 
 class UndefinedScoresError(Exception):
     """Error returned if scores are not defined."""
 
 
+_loaded_answer_scores: dict[
+    tuple[Survey, str],
+    tuple[tuple[int, int], dict[str, int | None]],
+] = {}
+
+
+def _get_answer_scores(
+    survey: Survey,
+    question_title: str,
+) -> dict[str, int | None]:
+    definitions_version = get_file_version(get_definition_data_path(survey))
+    answer_scores = _loaded_answer_scores.get((survey, question_title))
+    if answer_scores is None or answer_scores[0] != definitions_version:
+        answer_scores = (
+            definitions_version,
+            _load_answer_scores(survey, question_title),
+        )
+        _loaded_answer_scores[(survey, question_title)] = answer_scores
+    return answer_scores[1]
+
+
+def _load_answer_scores(
+    survey: Survey,
+    question_title: str,
+) -> dict[str, int | None]:
+    # Answers without defined score are mapped to None
+    answer_scores = {}
+    for answer_definition in load_answer_definitions(survey, question_title):
+        answer_key = answer_definition["key"]
+        if "score" in answer_definition:
+            answer_scores[answer_key] = answer_definition["score"]
+        elif survey is Survey.COMPREHENSION:
+            answer_scores[answer_key] = COMPREHENSION_SCORES[answer_key]
+        else:
+            answer_scores[answer_key] = None
+    return answer_scores
+
+
 def get_single_score(
     survey: Survey,
     question_title: str,
     answer: any,
 ) -> int | None:
     """Get the answer score for a survey question."""
-    answer_definitions = load_answer_definitions(
-        survey,
-        question_title,
-    )
-    answer_definition = next(
-        (
-            answer_definition
-            for answer_definition in answer_definitions
-            if answer_definition["key"] == answer
-        ),
-        None,
-    )
-    if answer_definition is None:
+    answer_scores = _get_answer_scores(survey, question_title)
+    if answer not in answer_scores:
         return None
-    if "score" in answer_definition:
-        answer_score = answer_definition["score"]
-    elif survey is Survey.COMPREHENSION:
-        comprehension_scores = {
-            "strongly_disagree": 1,
-            "disagree": 2,
-            "agree": 3,
-            "strongly_agree": 4,
-        }
-        answer_score = comprehension_scores[answer_definition["key"]]
-    else:
+    answer_score = answer_scores[answer]
+    if answer_score is None:
         message = f"Define scores for {survey.name}"
         raise UndefinedScoresError(message)
     return answer_score
 
 
+def _get_question_scores(
+    survey: Survey,
+    answers: Series,
+) -> Series:
+    answer_scores = _get_answer_scores(survey, answers.name)
+    undefined_scores = [
+        answer_key
+        for answer_key, answer_score in answer_scores.items()
+        if answer_score is None
+    ]
+    if answers.isin(undefined_scores).any():
+        message = f"Define scores for {survey.name}"
+        raise UndefinedScoresError(message)
+    return answers.map(answer_scores).astype(float)
+
+
 def get_defined_scores(survey: Survey, data: DataFrame = None) -> DataFrame:
     """Get scores per participant for a survey.
 
@@ -172,31 +272,28 @@ def get_defined_scores(survey: Survey, data: DataFrame = None) -> DataFrame:
     """
     if data is None:
         data = get_survey_results(survey)
-    definitions = load_data_from_file(
+    definitions = load_cached_data_from_file(
         get_definition_data_path(survey),
     )
-    score_data = []
-    for _, row in data.iterrows():
-        participant_id = row[PARTICIPANT_ID]
-        score = 0
-        all_not_answered = True
-        for _, question_row in definitions.iterrows():
-            question_title = question_row["title"]
-            if question_title not in row:
-                continue
-            answer = row[question_title]
-            answer_score = get_single_score(survey, question_title, answer)
-            if answer_score is None:
-                continue
-            all_not_answered = False
-            score += answer_score
-        if all_not_answered:
-            score_data.append([participant_id, None])
-        else:
-            score_data.append(
-                [participant_id, score],
-            )
-    return DataFrame(score_data, columns=[PARTICIPANT_ID, SCORE_COLUMN])
+    question_scores = [
+        _get_question_scores(survey, data[question_title])
+        for question_title in definitions["title"]
+        if question_title in data.columns
+    ]
+    # Participants without any scored answer get no score
+    scores = (
+        concat(question_scores, axis=1).sum(axis=1, min_count=1)
+        if len(question_scores) > 0
+        else Series(None, index=data.index, dtype=float)
+    )
+    if scores.notna().all():
+        scores = scores.astype(int)
+    return DataFrame(
+        {
+            PARTICIPANT_ID: data[PARTICIPANT_ID].to_numpy(),
+            SCORE_COLUMN: scores.to_numpy(),
+        },
+    )
 
 
 def get_manual_progress_data() -> dict:
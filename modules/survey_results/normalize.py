@@ -3,6 +3,7 @@
 The study group can be inferred from the participant ID later anyway.
 """
 
+import re
 from pathlib import Path
 
 import pandas as pd
@@ -17,7 +18,7 @@ from modules.definitions.types import Survey
 from modules.survey_results.get_data import get_survey_results
 from modules.utils.data import (
     get_definition_data_path,
-    load_data_from_file,
+    load_cached_data_from_file,
 )
 
 
@@ -41,7 +42,7 @@ def replace_in_columns(
     column_formulation_replacement: str,
 ) -> list[str]:
     """Get columns with replaced formulations."""
-    survey_definition = load_data_from_file(
+    survey_definition = load_cached_data_from_file(
         get_definition_data_path(survey),
     )
     columns = survey_definition.title
@@ -112,18 +113,26 @@ def _create_normalized_dictionary(
     column_formulation_replacement: str,
 ) -> None:
     """Create normalized dictionary file."""
-    with Path.open(
-        get_definition_data_path(survey),
-        "r",
-    ) as survey_definition_file:
-        survey_definition = survey_definition_file.read()
-        normalized_survey_definition = _replace_in_column(
-            column=survey_definition,
-            remove_column_formulations=remove_column_formulations,
-            column_formulation_replacement=column_formulation_replacement,
-        )
-        with Path.open(
+    # Replace all formulations in one pass per line
+    formulation_pattern = re.compile(
+        "|".join(
+            re.escape(formulation) for formulation in remove_column_formulations
+        ),
+    )
+    with (
+        Path.open(
+            get_definition_data_path(survey),
+            "r",
+        ) as survey_definition_file,
+        Path.open(
             get_definition_data_path(normalized_survey),
             "w",
-        ) as normalized_definition_file:
-            normalized_definition_file.write(normalized_survey_definition)
+        ) as normalized_definition_file,
+    ):
+        for line in survey_definition_file:
+            normalized_definition_file.write(
+                formulation_pattern.sub(
+                    lambda _: column_formulation_replacement,
+                    line,
+                ),
+            )
@@ -71,28 +71,37 @@ def _load_original_survey_data(file_path: Path) -> DataFrame:
     return original_survey_data
 
 
-def _files_did_change() -> bool:
-    preprocessing_paths = _get_preprocessing_file_list()
-    generated_data_paths = [
-        Path(string_path) for string_path in GENERATED_DATA_FILES
-    ]
-    for file_path in [*preprocessing_paths, *generated_data_paths]:
-        if not Path(file_path).exists():
-            return True
-    for file_path in preprocessing_paths:
-        preprocessed_path = get_preprocessed_path(file_path)
-        if not preprocessed_path.exists():
-            return True
-        original_data_date = get_last_file_modification(file_path)
-        preprocessed_data_date = get_last_file_modification(preprocessed_path)
-        if original_data_date > preprocessed_data_date:
+def _get_modification_time(path: Path) -> float | None:
+    # Stat once instead of testing existence and modification separately
+    try:
+        return get_last_file_modification(path)
+    except FileNotFoundError:
+        return None
+
+
+def _file_did_change(file_path: Path) -> bool:
+    preprocessed_data_date = _get_modification_time(
+        get_preprocessed_path(file_path),
+    )
+    if preprocessed_data_date is None:
+        return True
+    original_data_date = _get_modification_time(file_path)
+    if (
+        original_data_date is None
+        or original_data_date > preprocessed_data_date
+    ):
+        return True
+    manual_data_date = _get_modification_time(get_manual_path(file_path))
+    return manual_data_date is not None and (
+        manual_data_date > preprocessed_data_date
+    )
+
+
+def _files_did_change(preprocessing_paths: list[Path]) -> bool:
+    for string_path in GENERATED_DATA_FILES:
+        if not Path(string_path).exists():
             return True
-        manual_path = get_manual_path(file_path)
-        if manual_path.exists():
-            manual_data_date = get_last_file_modification(manual_path)
-            if manual_data_date > preprocessed_data_date:
-                return True
-    return False
+    return any(_file_did_change(file_path) for file_path in preprocessing_paths)
 
 
 def get_preprocessed_path(unprocessed_path: Path) -> Path:
@@ -104,9 +113,10 @@ def get_preprocessed_path(unprocessed_path: Path) -> Path:
 
 def maybe_preprocess_study_results() -> None:
     """Potentially do preprocessing, if needed."""
-    files_did_change = _files_did_change()
+    preprocessing_paths = _get_preprocessing_file_list()
+    files_did_change = _files_did_change(preprocessing_paths)
     participant_ids = set()
-    for file_path in _get_preprocessing_file_list():
+    for file_path in preprocessing_paths:
         if files_did_change:
             survey_results = anonymize_results(
                 _load_original_survey_data(file_path),
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
@@ -37,10 +38,7 @@ def _normalize_survey_name(column_name: str) -> str:
 
 
 def _normalize_survey_names(progress_data: DataFrame) -> DataFrame:
-    progress_data.columns = [
-        _normalize_survey_name(column_name)
-        for column_name in progress_data.columns
-    ]
+    progress_data.columns = progress_data.columns.map(_normalize_survey_name)
     return progress_data
 
 
@@ -64,26 +62,36 @@ def _combine_progress_data() -> DataFrame:
         how="outer",
         on=PARTICIPANT_ID,
     ).drop_duplicates()
-    manual_time_point_overwrites = get_manual_progress_data()
-    for participant_id in manual_time_point_overwrites:
-        manual_time_points = manual_time_point_overwrites[participant_id]
-        for progress_column in manual_time_points:
-            time_point = manual_time_points[progress_column]
-            row_index = combined_data[
-                combined_data[PARTICIPANT_ID] == participant_id
-            ].index
-            if len(row_index) != 1:
-                error_message = (
-                    "🚨 Expecting to find exactly one row in "
-                    f"progress data for participant ID {participant_id}"
-                )
-                raise ThisShouldNeverHappenError(error_message)
-            combined_data.loc[row_index, progress_column] = time_point
+    manual_overwrites = get_manual_progress_data()
+    if len(manual_overwrites) == 0:
+        return combined_data
+    participant_row_counts = combined_data[PARTICIPANT_ID].value_counts()
+    column_overwrites = {}
+    for participant_id, manual_time_points in manual_overwrites.items():
+        if len(manual_time_points) == 0:
+            continue
+        if participant_row_counts.get(participant_id, 0) != 1:
+            error_message = (
+                "🚨 Expecting to find exactly one row in "
+                f"progress data for participant ID {participant_id}"
+            )
+            raise ThisShouldNeverHappenError(error_message)
+        for progress_column, time_point in manual_time_points.items():
+            column_overwrites.setdefault(progress_column, {})[
+                participant_id
+            ] = time_point
+    # Overwrite the time points of all participants in a column at once
+    for progress_column, time_points in column_overwrites.items():
+        participant_ids = combined_data[PARTICIPANT_ID]
+        overwritten_rows = participant_ids.isin(time_points)
+        combined_data.loc[overwritten_rows, progress_column] = participant_ids[
+            overwritten_rows
+        ].map(time_points)
     return combined_data
 
 
 def _normalize_time_point(time_point: str) -> str:
-    return time_point.split(" ")[0]
+    return time_point.split(" ", maxsplit=1)[0]
 
 
 def _test_that_valid_time_points_are_unique(
@@ -91,19 +99,17 @@ def _test_that_valid_time_points_are_unique(
     survey_name: str,
     participant_survey_data: DataFrame,
     valid_time_points: list[str],
+    last_survey_modification: datetime,
 ) -> tuple[list, list]:
     log_content = []
     invalid_time_point_indices = []
+    time_point_positions = participant_survey_data.groupby(
+        TIME_POINT,
+        sort=False,
+    ).indices
     for time_point in valid_time_points:
-        surveys_with_time_point = participant_survey_data[
-            participant_survey_data[TIME_POINT] == time_point
-        ]
-        if len(surveys_with_time_point) == 0:
-            last_survey_modification = datetime.fromtimestamp(  # noqa: DTZ006
-                get_latest_file_modification(
-                    Path(SURVEY_DIRECTORY).iterdir(),
-                ),
-            )
+        positions = time_point_positions.get(time_point, [])
+        if len(positions) == 0:
             missing_time_point = datetime.fromisoformat(time_point)
             if last_survey_modification.date() > missing_time_point.date():
                 message = (
@@ -111,27 +117,24 @@ def _test_that_valid_time_points_are_unique(
                     f"{participant_id} in {survey_name}\n"
                 )
                 log_content.append(message)
-        if len(surveys_with_time_point) > 1:
+        if len(positions) > 1:
             message = (
                 f"ℹ️ Removed duplicate time point {time_point} for "  # noqa: RUF001
                 f"participant {participant_id} from {survey_name}\n"
             )
             log_content.append(message)
-            survey_content = participant_survey_data.drop(
-                TIME_POINT,
-                axis=1,
+            duplicated_rows = (
+                participant_survey_data.drop(TIME_POINT, axis=1)
+                .iloc[positions]
+                .duplicated(keep=False)
+                .sum()
             )
-            time_point_content = survey_content.loc[
-                surveys_with_time_point.index
-            ]
-            duplicated_rows = time_point_content.duplicated(
-                keep=False,
-            ).sum()
-            if duplicated_rows != len(surveys_with_time_point):
+            if duplicated_rows != len(positions):
                 message = "⚠️ Rows are not the same! Only keeping last entry.\n"
                 log_content.append(message)
-            for index, _ in surveys_with_time_point.iloc[:-1].iterrows():
-                invalid_time_point_indices.append(index)
+            invalid_time_point_indices += participant_survey_data.index[
+                positions[:-1]
+            ].tolist()
     return log_content, invalid_time_point_indices
 
 
@@ -141,18 +144,15 @@ def _test_that_time_points_are_valid(
     participant_survey_data: DataFrame,
     valid_time_points: list[str],
 ) -> tuple[list, list]:
-    log_content = []
-    invalid_time_point_indices = []
-    for index, row in participant_survey_data.iterrows():
-        time_point = row[TIME_POINT]
-        if time_point not in valid_time_points:
-            message = (
-                f"ℹ️ Removed time point {time_point} not in progress data"  # noqa: RUF001
-                f" for participant {participant_id} from {survey_name}\n"
-            )
-            log_content.append(message)
-            invalid_time_point_indices.append(index)
-    return log_content, invalid_time_point_indices
+    invalid_time_points = participant_survey_data[
+        ~participant_survey_data[TIME_POINT].isin(valid_time_points)
+    ][TIME_POINT]
+    log_content = [
+        f"ℹ️ Removed time point {time_point} not in progress data"  # noqa: RUF001
+        f" for participant {participant_id} from {survey_name}\n"
+        for time_point in invalid_time_points
+    ]
+    return log_content, invalid_time_points.index.tolist()
 
 
 def _test_time_point_validity(
@@ -160,12 +160,16 @@ def _test_time_point_validity(
     survey_name: str,
     participant_survey_data: DataFrame,
     valid_time_points: list[str],
+    last_survey_modification: datetime,
 ) -> tuple[list, list]:
     log_content = []
     invalid_time_point_indices = []
     tests = [
         _test_that_time_points_are_valid,
-        _test_that_valid_time_points_are_unique,
+        partial(
+            _test_that_valid_time_points_are_unique,
+            last_survey_modification=last_survey_modification,
+        ),
     ]
     for test in tests:
         new_log_content, new_invalid_indices = test(
@@ -179,48 +183,72 @@ def _test_time_point_validity(
     return log_content, invalid_time_point_indices
 
 
+def _get_valid_time_points(
+    survey_progress_data: DataFrame,
+    participant_ids: list[str],
+) -> dict[str, list[str]]:
+    progress_columns = [
+        column
+        for column in survey_progress_data.columns
+        if column != PARTICIPANT_ID
+    ]
+    if len(progress_columns) == 0:
+        return {}
+    participant_progress_data = survey_progress_data[
+        survey_progress_data[PARTICIPANT_ID].isin(participant_ids)
+    ]
+    duplicated_participants = participant_progress_data[
+        participant_progress_data[PARTICIPANT_ID].duplicated()
+    ][PARTICIPANT_ID]
+    if len(duplicated_participants) > 0:
+        error_message = (
+            "🚨 Participant progress should be unique in progress data "
+            f"for {duplicated_participants.iloc[0]}!"
+        )
+        raise ThisShouldNeverHappenError(error_message)
+    return {
+        participant_id: [
+            _normalize_time_point(time_point)
+            for time_point in time_points
+            if not value_is_nan(time_point)
+        ]
+        for participant_id, *time_points in participant_progress_data[
+            [PARTICIPANT_ID, *progress_columns]
+        ].itertuples(index=False, name=None)
+    }
+
+
 def _get_invalid_time_point_indices(
     survey_name: str,
     survey_data: DataFrame,
     survey_progress_data: DataFrame,
     participant_ids: list[str],
+    last_survey_modification: datetime,
 ) -> tuple[list, list]:
     invalid_time_point_indices = []
     log_content = []
+    normalized_survey_data = survey_data.assign(
+        **{TIME_POINT: survey_data[TIME_POINT].map(_normalize_time_point)},
+    )
+    survey_data_by_participant = dict(
+        tuple(normalized_survey_data.groupby(PARTICIPANT_ID, sort=False)),
+    )
+    participant_ids = [
+        participant_id
+        for participant_id in participant_ids
+        if participant_id in survey_data_by_participant
+    ]
+    valid_time_points = _get_valid_time_points(
+        survey_progress_data,
+        participant_ids,
+    )
     for participant_id in participant_ids:
-        if participant_id not in survey_data[PARTICIPANT_ID].array:
-            continue
-        valid_time_points = []
-        for column in survey_progress_data.columns:
-            if column == PARTICIPANT_ID:
-                continue
-            participant_progress_data = survey_progress_data[
-                survey_progress_data[PARTICIPANT_ID] == participant_id
-            ]
-            if len(participant_progress_data) == 0:
-                continue
-            if len(participant_progress_data) > 1:
-                error_message = (
-                    "🚨 Participant progress should be unique in progress data "
-                    f"for {participant_id}!"
-                )
-                raise ThisShouldNeverHappenError(error_message)
-            time_point = participant_progress_data[column].array[0]
-            if not value_is_nan(time_point):
-                valid_time_points.append(
-                    _normalize_time_point(time_point),
-                )
-        participant_survey_data = survey_data[
-            survey_data[PARTICIPANT_ID] == participant_id
-        ].copy(deep=True)
-        participant_survey_data[TIME_POINT] = participant_survey_data[
-            TIME_POINT
-        ].apply(_normalize_time_point)
         new_log_content, new_invalid_indices = _test_time_point_validity(
             participant_id,
             survey_name,
-            participant_survey_data,
-            valid_time_points,
+            survey_data_by_participant[participant_id],
+            valid_time_points.get(participant_id, []),
+            last_survey_modification,
         )
         log_content += new_log_content
         invalid_time_point_indices += new_invalid_indices
@@ -260,6 +288,10 @@ def maybe_combine_progress_data_and_clean_surveys(
     )
     if survey_files_did_change:
         removed_entries_log_content = []
+        # Determine before cleaning rewrites the survey files
+        last_survey_modification = datetime.fromtimestamp(  # noqa: DTZ006
+            get_latest_file_modification(Path(SURVEY_DIRECTORY).iterdir()),
+        )
         for survey_path in sorted(Path(SURVEY_DIRECTORY).iterdir()):
             if PREPROCESSED_FILE_SUFFIX in survey_path.suffixes:
                 survey_name = survey_path.name.split(".")[0]
@@ -280,10 +312,13 @@ def maybe_combine_progress_data_and_clean_surveys(
                             [PARTICIPANT_ID, *survey_progress_columns]
                         ],
                         participant_ids,
+                        last_survey_modification,
                     )
                 )
                 removed_entries_log_content += log_content
-                clean_survey_data = survey_data.drop(invalid_time_point_indices)
+                clean_survey_data = survey_data[
+                    ~survey_data.index.isin(invalid_time_point_indices)
+                ]
                 write_data_frame(
                     clean_survey_data,
                     survey_path,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from pandas import DataFrame
@@ -17,23 +18,17 @@ from modules.definitions.constants import (
     get_bool_from_env,
 )
 from modules.definitions.types import StudyGroup
-from modules.utils.anonymization import get_participant_id_map, reveal_ehive_id
+from modules.utils.anonymization import reveal_ehive_id
 from modules.utils.data import (
+    get_file_version,
     load_data_from_file,
     value_is_nan,
     write_data_frame,
 )
-from modules.utils.redcap import get_redcap_users
-
-
-def _get_redcap_user_with_ehive_id(
-    redcap_users: list[dict],
-    ehive_id: str,
-) -> dict | None:
-    return next(
-        (user for user in redcap_users if user["ehive_id"] == ehive_id),
-        None,
-    )
+from modules.utils.redcap import (
+    get_redcap_users,
+    get_redcap_users_by_ehive_id,
+)
 
 
 def get_study_group_for_redcap_user(redcap_user: dict) -> StudyGroup | None:
@@ -44,54 +39,26 @@ def get_study_group_for_redcap_user(redcap_user: dict) -> StudyGroup | None:
     return REDCAP_STUDY_GROUPS[redcap_study_group]
 
 
-def _get_study_group(
-    redcap_users: list[dict],
-    ehive_id: str,
-) -> StudyGroup | None:
-    redcap_user = _get_redcap_user_with_ehive_id(redcap_users, ehive_id)
+def _get_redcap_values(
+    redcap_user: dict | None,
+) -> tuple[StudyGroup | None, True | None, bool | None]:
     if redcap_user is None:
-        return None
-    return get_study_group_for_redcap_user(redcap_user)
-
-
-def _get_testing_completed(
-    redcap_users: list[dict],
-    ehive_id: str,
-    study_group: StudyGroup | None,
-) -> True | None:
+        return None, None, None
+    study_group = get_study_group_for_redcap_user(redcap_user)
     if study_group is None:
-        return None
-    redcap_user = _get_redcap_user_with_ehive_id(redcap_users, ehive_id)
-    if redcap_user is None:
-        return None
+        return None, None, None
+    pharme_testing_completed = redcap_user["pharme_data_uploaded"] != ""
     if study_group is StudyGroup.PHARME:
-        testing_completed = redcap_user["pharme_data_uploaded"]
+        testing_completed = pharme_testing_completed
+        crossover_completed = redcap_user["crossover_complete"] == "2"
     else:
-        testing_completed = redcap_user["counsel_date"]
-    if testing_completed == "":
-        return None
-    return True
-
-
-def _get_crossover_completed(
-    redcap_users: list[dict],
-    ehive_id: str,
-    study_group: StudyGroup | None,
-) -> bool | None:
-    if study_group is None:
-        return None
-    redcap_user = _get_redcap_user_with_ehive_id(redcap_users, ehive_id)
-    if redcap_user is None:
-        return None
-    if study_group is StudyGroup.PHARME:
-        return redcap_user["crossover_complete"] == "2"
-    other_study_group = StudyGroup.PHARME
-    other_intervention_completed = _get_testing_completed(
-        redcap_users,
-        ehive_id,
-        other_study_group,
+        testing_completed = redcap_user["counsel_date"] != ""
+        crossover_completed = pharme_testing_completed
+    return (
+        study_group,
+        True if testing_completed else None,
+        crossover_completed,
     )
-    return other_intervention_completed is not None
 
 
 def _initialize_redcap_data() -> DataFrame:
@@ -105,25 +72,67 @@ def _initialize_redcap_data() -> DataFrame:
     )
 
 
-def _get_study_group_string(
-    redcap_data: DataFrame,
-    participant_id: str,
-) -> str:
-    return redcap_data[redcap_data[PARTICIPANT_ID] == participant_id][
-        STUDY_GROUP
-    ].to_list()[0]
+def _parse_study_group(study_group_string: str) -> StudyGroup | None:
+    if value_is_nan(study_group_string):
+        return None
+    return StudyGroup(study_group_string)
 
 
-def get_study_group(participant_id: str) -> StudyGroup:
-    """Get study group for a single participant."""
+@lru_cache(maxsize=1)
+def _load_study_groups(
+    redcap_data_version: tuple[int, int] | None,  # noqa: ARG001, part of cache key
+) -> dict[str, StudyGroup | None]:
     redcap_data = get_redcap_data()
-    study_group_string = _get_study_group_string(redcap_data, participant_id)
-    if value_is_nan(study_group_string):
+    return {
+        participant_id: _parse_study_group(study_group_string)
+        for participant_id, study_group_string in zip(
+            redcap_data[PARTICIPANT_ID],
+            redcap_data[STUDY_GROUP],
+            strict=True,
+        )
+    }
+
+
+@lru_cache(maxsize=len(StudyGroup))
+def _load_study_group_participants(
+    study_group: StudyGroup,
+    redcap_data_version: tuple[int, int] | None,
+) -> frozenset[str]:
+    return frozenset(
+        participant_id
+        for participant_id, participant_study_group in _load_study_groups(
+            redcap_data_version,
+        ).items()
+        if participant_study_group is study_group
+    )
+
+
+def _get_redcap_data_version() -> tuple[int, int] | None:
+    redcap_data_file = Path(REDCAP_DATA_FILE)
+    if not redcap_data_file.exists():
         return None
-    return next(
-        study_group
-        for study_group in StudyGroup
-        if study_group.value == study_group_string
+    return get_file_version(redcap_data_file)
+
+
+def _get_loaded_study_groups() -> dict[str, StudyGroup | None]:
+    return _load_study_groups(_get_redcap_data_version())
+
+
+def get_study_group(participant_id: str) -> StudyGroup:
+    """Get study group for a single participant."""
+    return _get_loaded_study_groups()[participant_id]
+
+
+def get_study_groups() -> dict[str, StudyGroup | None]:
+    """Get study groups for all participants."""
+    return dict(_get_loaded_study_groups())
+
+
+def get_study_group_participants(study_group: StudyGroup) -> frozenset[str]:
+    """Get IDs of all participants in a study group."""
+    return _load_study_group_participants(
+        study_group,
+        _get_redcap_data_version(),
     )
 
 
@@ -135,9 +144,13 @@ def get_redcap_data() -> DataFrame:
     return load_data_from_file(REDCAP_DATA_FILE)
 
 
-def redcap_data_are_complete() -> bool:
-    """Check if all participants have a study group assigned."""
-    redcap_data = get_redcap_data()
+def redcap_data_are_complete(redcap_data: DataFrame | None = None) -> bool:
+    """Check if all participants have a study group assigned.
+
+    Checks the stored REDCap data if no (already loaded) data are passed.
+    """
+    if redcap_data is None:
+        redcap_data = get_redcap_data()
     redcap_data_are_incomplete = (
         redcap_data is None
         or redcap_data.empty
@@ -152,19 +165,17 @@ def maybe_update_redcap_data(
 ) -> None:
     """Update data from REDCap."""
     redcap_data = get_redcap_data()
-    redcap_data_are_valid = all(
-        participant_id in participant_ids
-        for participant_id in redcap_data[PARTICIPANT_ID].array
-    )
+    present_ids = redcap_data[PARTICIPANT_ID].tolist()
+    participant_id_set = set(participant_ids)
+    redcap_data_are_valid = set(present_ids) <= participant_id_set
     if not redcap_data_are_valid:
         redcap_data = _initialize_redcap_data()
-    all_participants_are_covered = all(
-        participant_id in redcap_data[PARTICIPANT_ID].array
-        for participant_id in participant_ids
-    )
+        present_ids = []
+    present_id_set = set(present_ids)
+    all_participants_are_covered = participant_id_set <= present_id_set
     logger = logging.getLogger(__name__)
     if all_participants_are_covered:
-        data_are_complete = redcap_data_are_complete()
+        data_are_complete = redcap_data_are_complete(redcap_data)
         if data_are_complete:
             logger.info(
                 "Loaded REDcap data from file, the data are complete for "
@@ -182,37 +193,30 @@ def maybe_update_redcap_data(
             )
             return
     logger.info("Updating REDcap data...")
-    redcap_users = get_redcap_users()
-    participant_id_map = get_participant_id_map()
-    next_index = len(redcap_data.index)
+    redcap_users_by_ehive_id = get_redcap_users_by_ehive_id(
+        get_redcap_users(),
+    )
+    participant_rows = {}
     for participant_id in participant_ids:
-        present_ids = redcap_data[PARTICIPANT_ID].array
-        if participant_id in present_ids:
-            data_index = redcap_data[
-                redcap_data[PARTICIPANT_ID] == participant_id
-            ].index
-        else:
-            data_index = next_index
-            next_index += 1
-        ehive_id = reveal_ehive_id(participant_id_map, participant_id)
-        study_group = _get_study_group(
-            redcap_users,
-            ehive_id,
-        )
-        testing_completed = _get_testing_completed(
-            redcap_users,
-            ehive_id,
-            study_group,
-        )
-        crossover_completed = _get_crossover_completed(
-            redcap_users,
-            ehive_id,
-            study_group,
+        study_group, testing_completed, crossover_completed = (
+            _get_redcap_values(
+                redcap_users_by_ehive_id.get(reveal_ehive_id(participant_id)),
+            )
         )
-        redcap_data.loc[data_index] = [
+        participant_rows[participant_id] = [
             participant_id,
             study_group.value if study_group is not None else None,
             testing_completed,
             crossover_completed,
         ]
+    # Present participants keep their position, new ones are appended
+    updated_ids = present_ids + [
+        participant_id
+        for participant_id in participant_ids
+        if participant_id not in present_id_set
+    ]
+    redcap_data = DataFrame(
+        [participant_rows[participant_id] for participant_id in updated_ids],
+        columns=redcap_data.columns,
+    )
     write_data_frame(redcap_data, REDCAP_DATA_FILE)
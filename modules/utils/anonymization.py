@@ -1,6 +1,9 @@
 """Code for survey anonymization."""
 
+from __future__ import annotations
+
 import uuid
+from functools import lru_cache
 from pathlib import Path
 
 from pandas import DataFrame
@@ -11,36 +14,65 @@ from modules.definitions.constants import (
     PARTICIPANT_ID_MAP_FILE,
 )
 from modules.definitions.types import ThisShouldNeverHappenError
-from modules.utils.data import load_data_from_file, write_data_frame
+from modules.utils.data import (
+    get_file_version,
+    load_cached_data_from_file,
+    write_data_frame,
+)
 
 
-def get_participant_id_map() -> dict[str, str]:
-    """Read the stored map of ehive and participant IDs."""
+def _get_participant_id_map_version() -> tuple[int, int] | None:
     participant_id_map_file = Path(PARTICIPANT_ID_MAP_FILE)
     if not participant_id_map_file.exists():
+        return None
+    return get_file_version(participant_id_map_file)
+
+
+@lru_cache(maxsize=1)
+def _load_participant_id_map(
+    participant_id_map_version: tuple[int, int] | None,
+) -> dict[str, str]:
+    if participant_id_map_version is None:
         return {}
-    participant_id_map_data = load_data_from_file(PARTICIPANT_ID_MAP_FILE)
-    participant_id_map = {}
-    for _, id_mapping in participant_id_map_data.iterrows():
-        ehive_id = id_mapping[EHIVE_ID]
-        participant_id = id_mapping[PARTICIPANT_ID]
-        participant_id_map[ehive_id] = participant_id
-    return participant_id_map
-
-
-def reveal_ehive_id(
-    participant_map: dict[str, str],
-    participant_id: str,
-) -> str:
-    """Get the ehive ID from the anonymous participant ID. Use with caution."""
-    inverted_participant_map = {
+    participant_id_map_data = load_cached_data_from_file(
+        PARTICIPANT_ID_MAP_FILE,
+    )
+    return dict(
+        zip(
+            participant_id_map_data[EHIVE_ID],
+            participant_id_map_data[PARTICIPANT_ID],
+            strict=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_ehive_id_map(
+    participant_id_map_version: tuple[int, int] | None,
+) -> dict[str, str]:
+    return {
         participant_id: ehive_id
-        for ehive_id, participant_id in participant_map.items()
+        for ehive_id, participant_id in _load_participant_id_map(
+            participant_id_map_version,
+        ).items()
     }
-    return inverted_participant_map[participant_id]
 
 
-def _get_new_id(current_ids: list[str]) -> str:
+def get_participant_id_map() -> dict[str, str]:
+    """Read the stored map of ehive and participant IDs.
+
+    The map is cached until the map file changes; a copy is returned so the
+    cached map is not altered.
+    """
+    return dict(_load_participant_id_map(_get_participant_id_map_version()))
+
+
+def reveal_ehive_id(participant_id: str) -> str:
+    """Get the ehive ID from the anonymous participant ID. Use with caution."""
+    return _load_ehive_id_map(_get_participant_id_map_version())[participant_id]
+
+
+def _get_new_id(current_ids: set[str]) -> str:
     new_id = str(uuid.uuid4())
     while new_id in current_ids:
         new_id = str(uuid.uuid4())
@@ -48,16 +80,13 @@ def _get_new_id(current_ids: list[str]) -> str:
 
 
 def _save_user_map(user_id_map: dict[str, str]) -> None:
-    participant_id_map_data = []
-    for ehive_id, participant_id in user_id_map.items():
-        participant_id_map_data.append(
+    write_data_frame(
+        DataFrame(
             {
-                EHIVE_ID: ehive_id,
-                PARTICIPANT_ID: participant_id,
+                EHIVE_ID: list(user_id_map.keys()),
+                PARTICIPANT_ID: list(user_id_map.values()),
             },
-        )
-    write_data_frame(
-        DataFrame.from_dict(participant_id_map_data),
+        ),
         PARTICIPANT_ID_MAP_FILE,
     )
 
@@ -65,18 +94,16 @@ def _save_user_map(user_id_map: dict[str, str]) -> None:
 def anonymize_results(survey_results: DataFrame) -> DataFrame:
     """Anonymizes survey results with user ID map."""
     participant_id_map = get_participant_id_map()
-    for index, result in survey_results.iterrows():
-        ehive_id = result[PARTICIPANT_ID]
-        if ehive_id in participant_id_map.values():
-            error_message = (
-                "🚨 Attempting to anonymize an already anonymized ID!"
-            )
-            raise ThisShouldNeverHappenError(error_message)
-        if ehive_id in participant_id_map:
-            anonymous_id = participant_id_map[ehive_id]
-        else:
-            anonymous_id = _get_new_id(current_ids=participant_id_map.values())
+    anonymous_ids = set(participant_id_map.values())
+    ehive_ids = survey_results[PARTICIPANT_ID]
+    if ehive_ids.isin(anonymous_ids).any():
+        error_message = "🚨 Attempting to anonymize an already anonymized ID!"
+        raise ThisShouldNeverHappenError(error_message)
+    for ehive_id in ehive_ids.unique():
+        if ehive_id not in participant_id_map:
+            anonymous_id = _get_new_id(current_ids=anonymous_ids)
             participant_id_map[ehive_id] = anonymous_id
-        survey_results.loc[index, PARTICIPANT_ID] = anonymous_id
+            anonymous_ids.add(anonymous_id)
+    survey_results[PARTICIPANT_ID] = ehive_ids.map(participant_id_map)
     _save_user_map(participant_id_map)
     return survey_results
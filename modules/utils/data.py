@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
@@ -43,9 +44,37 @@ def get_last_file_modification(path: Path) -> float:
     return path.stat().st_mtime
 
 
+def get_file_version(path: Path) -> tuple[int, int]:
+    """Get modification time and size to tell whether a file changed."""
+    file_stat = Path(path).stat()
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+_loaded_data_files: dict[Path, tuple[tuple[int, int], DataFrame]] = {}
+
+
+def load_cached_data_from_file(path: Path) -> DataFrame:
+    """Load DataFrame from CSV file path without copying it.
+
+    Loaded data are cached per path until the file changes and must not be
+    altered; use load_data_from_file to get a copy.
+    """
+    path = Path(path)
+    file_version = get_file_version(path)
+    loaded_data_file = _loaded_data_files.get(path)
+    if loaded_data_file is None or loaded_data_file[0] != file_version:
+        loaded_data_file = (file_version, pd.read_csv(path))
+        _loaded_data_files[path] = loaded_data_file
+    return loaded_data_file[1]
+
+
 def load_data_from_file(path: Path) -> DataFrame:
-    """Load DataFrame from CSV file path."""
-    return pd.read_csv(path)
+    """Load DataFrame from CSV file path.
+
+    Loaded data are cached until the file changes; a copy is returned so the
+    cached data are not altered.
+    """
+    return load_cached_data_from_file(path).copy()
 
 
 def get_data_path(data: Survey, preprocessed: bool = True) -> Path:  # noqa: FBT001, FBT002
@@ -73,6 +102,7 @@ def write_data_frame(
         index=False,
         mode=mode,
     )
+    _loaded_data_files.pop(Path(path), None)
 
 
 def value_is_nan(value) -> bool:  # noqa: ANN001
@@ -92,7 +122,7 @@ def _get_answer_definition(
     survey: Survey,
     row_index: int | str,
 ) -> Series:
-    definitions = load_data_from_file(get_definition_data_path(survey))
+    definitions = load_cached_data_from_file(get_definition_data_path(survey))
     if type(row_index) is str:
         row_index = definitions[definitions["title"] == row_index].index[0]
     return definitions.iloc[row_index]
@@ -208,20 +238,21 @@ def is_free_text_answer(survey: Survey, column: str) -> bool:
     return _get_answer_definition(survey, column)["type"] == "TEXTAREA"
 
 
-def get_score_interpretation(
-    score: float,
+def get_score_interpretations(
+    scores: Series,
     max_score_definition: OrderedDict,
-) -> str:
-    """Get the lowest matching score interpretation."""
-    for interpretation, max_value in max_score_definition.items():
-        if score <= max_value:
-            return interpretation
-    return None
+) -> Series:
+    """Get the lowest matching score interpretation for each score."""
+    return pd.cut(
+        scores,
+        bins=[-np.inf, *max_score_definition.values()],
+        labels=list(max_score_definition.keys()),
+    ).astype(object)
 
 
 def has_multiple_time_points(survey: Survey) -> bool:
     """Test if a survey has multiple time points."""
-    progress_data = load_data_from_file(
+    progress_data = load_cached_data_from_file(
         PROGRESS_DATA_FILE,
     )
     survey_columns = [
@@ -153,11 +153,12 @@ def get_interesting_comparison_results(comparison: Comparison) -> DataFrame:
     comparison_data["is_significant"] = significant_data
     significant_indices = comparison_data.index[significant_data]
     effect_interpretations = [
-        interpret_effect(
-            iterator[1]["effect_method"],
-            iterator[1]["effect_size"],
+        interpret_effect(effect_method, effect_size)
+        for effect_method, effect_size in zip(
+            comparison_data["effect_method"],
+            comparison_data["effect_size"],
+            strict=True,
         )
-        for iterator in comparison_data.iterrows()
     ]
     comparison_data["effect_interpretation"] = [
         effect_interpretation.name.lower()
@@ -247,11 +247,18 @@ def get_radar_chart_data(
     data = []
     study_groups = []
     participant_ids = []
-    for _, row in survey_data.iterrows():
+    score_columns = [is_score_answer(survey, column) for column in columns]
+    for participant_id, *answers in survey_data[
+        [PARTICIPANT_ID, *columns]
+    ].itertuples(index=False, name=None):
         participant_data = []
-        for column in columns:
-            answer = row[column]
-            if is_score_answer(survey, column):
+        for column, is_score_column, answer in zip(
+            columns,
+            score_columns,
+            answers,
+            strict=True,
+        ):
+            if is_score_column:
                 participant_data.append(answer)
             else:
                 score = get_single_score(survey, column, answer)
@@ -259,8 +266,8 @@ def get_radar_chart_data(
                     score = 0
                 participant_data.append(score)
         data.append(participant_data)
-        study_groups.append(get_study_group(row[PARTICIPANT_ID]))
-        participant_ids.append(row[PARTICIPANT_ID])
+        study_groups.append(get_study_group(participant_id))
+        participant_ids.append(participant_id)
     return data, study_groups, participant_ids
 
 
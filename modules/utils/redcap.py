@@ -2,7 +2,7 @@
 
 import requests
 
-from modules.definitions.constants import EHIVE_ID, PHARME_ID, get_config
+from modules.definitions.constants import EHIVE_ID, get_config
 
 
 def _get_from_redcap(content: str) -> list[dict]:
@@ -20,15 +20,12 @@ def _get_from_redcap(content: str) -> list[dict]:
     ).json()
 
 
-def get_pharme_id(
-    redcap_users: list[dict],
-    ehive_id: str,
-) -> str:
-    """Get PharMe ID from REDCap user with ehive ID."""
-    redcap_user = next(
-        user for user in redcap_users if user[EHIVE_ID] == ehive_id
-    )
-    return redcap_user[PHARME_ID]
+def get_redcap_users_by_ehive_id(redcap_users: list[dict]) -> dict[str, dict]:
+    """Map ehive IDs to REDCap users, keeping the first user per ehive ID."""
+    redcap_users_by_ehive_id = {}
+    for user in redcap_users:
+        redcap_users_by_ehive_id.setdefault(user[EHIVE_ID], user)
+    return redcap_users_by_ehive_id
 
 
 def get_redcap_users() -> list[dict]:
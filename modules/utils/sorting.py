@@ -12,15 +12,15 @@ NOT_ANSWERED_LABEL = "Not answered"
 NOT_ANSWERED_SORT_INDEX = SORT_LAST_INDEX + 1
 
 
-def _get_single_sort_index(value: str, label_definition: OrderedDict) -> int:
-    if value in label_definition:
-        return list(label_definition.keys()).index(value)
+def _get_single_sort_index(value: str, label_positions: dict[str, int]) -> int:
+    if value in label_positions:
+        return label_positions[value]
     if value == NOT_ANSWERED_LABEL:
         return NOT_ANSWERED_SORT_INDEX
     return SORT_LAST_INDEX
 
 
-def _get_sort_index(value: str, label_definition: OrderedDict) -> float:
+def _get_sort_index(value: str, label_positions: dict[str, int]) -> float:
     if value_is_nan(value):
         return -1
     if MULTIPLE_VALUES_SEPARATOR in value:
@@ -30,12 +30,15 @@ def _get_sort_index(value: str, label_definition: OrderedDict) -> float:
             factor = 1 if index == 0 else 0.1
             accumulated_sort_index += factor * _get_single_sort_index(
                 single_value,
-                label_definition,
+                label_positions,
             )
         return accumulated_sort_index
-    return _get_single_sort_index(value, label_definition)
+    return _get_single_sort_index(value, label_positions)
 
 
 def sort_by_label(values: Series, label_definition: OrderedDict) -> Series:
     """Sort series index or values by label definition."""
-    return [_get_sort_index(value, label_definition) for value in values]
+    label_positions = {
+        label: position for position, label in enumerate(label_definition)
+    }
+    return [_get_sort_index(value, label_positions) for value in values]
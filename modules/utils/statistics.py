@@ -3,6 +3,7 @@
 # Based on https://mverbakel.github.io/2021-02-24/non-inferiority-test
 from collections import OrderedDict
 from enum import Enum
+from functools import cache
 
 import numpy as np
 import pingouin
@@ -215,6 +216,17 @@ def are_study_groups_different_ordinal(
     )
 
 
+@cache
+def _get_fisher_values(
+    table: tuple[tuple[int, ...], ...],
+) -> tuple[float, float]:
+    # Keyed on the counts, so repeated tests of unchanged data are skipped
+    method = MonteCarloMethod(rng=np.random.default_rng(42))
+    result = fisher_exact(table, method=method)
+    _, cramers_v = _get_cramers_v(table)
+    return result.pvalue, cramers_v
+
+
 def are_study_groups_different_categorical(
     data: DataFrame,
     column: str,
@@ -225,10 +237,10 @@ def are_study_groups_different_categorical(
         for study_group in StudyGroup
     ]
     table = _create_comparison_table(comparison_data, column)
-    method = MonteCarloMethod(rng=np.random.default_rng(42))
-    result = fisher_exact(table, method=method)
-    _, cramers_v = _get_cramers_v(table)
-    return FisherResult(result.pvalue, cramers_v)
+    p_value, cramers_v = _get_fisher_values(
+        tuple(tuple(level_counts) for level_counts in table),
+    )
+    return FisherResult(p_value, cramers_v)
 
 
 def _get_paired_data(